@@ -6,14 +6,18 @@ automatic fallback, and intelligent backend selection based on hardware and
 model requirements.
 """
 
+import functools
 import logging
+import os
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Tuple, Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any, Callable, Union
 from dataclasses import dataclass
-from pathlib import Path
 
 from .model_backends import (
-    BackendType, BackendConfig, HardwareInfo, LoadingResult, 
+    BackendType, BackendConfig, HardwareInfo, HardwarePreference, LoadingResult, 
     GenerationConfig, ModelBackend, BackendRegistry, backend_registry,
     BackendError, InstallationError, HardwareError, ModelLoadingError
 )
@@ -22,7 +26,11 @@ from .monitoring import monitoring_manager, PerformanceMetrics
 from .logging_config import log_with_context, log_performance
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10; older interpreters get a regular one
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class BackendStatus:
     """Status information for a backend."""
     name: str
@@ -35,9 +43,36 @@ class BackendStatus:
     average_load_time: float = 0.0
 
 
+def _callback_property(event: str) -> property:
+    """Expose a manager event as an assignable callback attribute."""
+    def getter(self) -> Optional[Callable]:
+        if not self._listeners.get(event):
+            return None
+        return functools.partial(self._emit, event)
+    
+    def setter(self, callback: Optional[Callable]):
+        if callback is None:
+            self._listeners.pop(event, None)
+        else:
+            self._listeners[event] = (callback,)
+    
+    return property(getter, setter)
+
+
 class BackendManager:
     """Manages available backends and handles fallback logic."""
     
+    # Seconds that hardware info used for backend selection stays valid
+    HARDWARE_INFO_TTL = 5.0
+    
+    # Backends to prefer for an explicit hardware preference
+    PREFERRED_BACKENDS = {
+        # Backends that work well on CPU
+        HardwarePreference.CPU: (BackendType.LLAMAFILE.value, BackendType.CTRANSFORMERS.value),
+        # GPU-accelerated backends
+        HardwarePreference.GPU: (BackendType.CTRANSFORMERS.value, BackendType.TRANSFORMERS.value),
+    }
+    
     def __init__(self, hardware_detector: Optional[HardwareDetector] = None):
         """
         Initialize the backend manager.
@@ -53,17 +88,24 @@ class BackendManager:
         self.monitoring_manager = monitoring_manager
         self.performance_monitor = monitoring_manager.performance_monitor
         
-        # Register backends if not already registered
-        self._ensure_backends_registered()
-        
         # Backend management
         self.backends: Dict[str, ModelBackend] = {}
+        self._backends_lock = threading.Lock()
+        
         self.backend_status: Dict[str, BackendStatus] = {}
         self.current_backend: Optional[ModelBackend] = None
         self.current_model_path: Optional[str] = None
         
-        # Configuration
-        self.configs: Dict[str, BackendConfig] = {}
+        # Hardware info cached for backend selection (see _cached_hardware_info)
+        self._hw_info_cache: Optional[HardwareInfo] = None
+        self._hw_info_cached_at = 0.0
+        
+        # Memory budgets derived from the cached hardware info (see _memory_budgets)
+        self._budgets: Tuple[float, Optional[float]] = (0.0, None)
+        self._budgets_hw_info: Optional[HardwareInfo] = None
+        
+        # Configuration; defaults are filled in on first use (see configs)
+        self._configs: Dict[str, BackendConfig] = {}
         self.fallback_order = [
             BackendType.CTRANSFORMERS.value,
             BackendType.TRANSFORMERS.value,
@@ -71,14 +113,51 @@ class BackendManager:
             BackendType.LLAMA_CPP_PYTHON.value
         ]
         
-        # Callbacks
-        self.on_backend_changed: Optional[Callable[[str, str], None]] = None
-        self.on_fallback_triggered: Optional[Callable[[str, str, str], None]] = None
-        self.on_loading_progress: Optional[Callable[[str, int], None]] = None
+        # Callbacks by event ('backend_changed', 'fallback_triggered',
+        # 'loading_progress'); see on() and _emit()
+        self._listeners: Dict[str, Tuple[Callable, ...]] = {}
         
-        # Initialize
-        self._initialize_configs()
-        self._detect_available_backends()
+        # Backend registration, configs and availability probing are deferred
+        # to first use (see _ensure_ready)
+        self._ready = False
+        self._ready_lock = threading.Lock()
+    
+    def on(self, event: str, callback: Callable):
+        """
+        Register a callback for a manager event.
+        
+        Args:
+            event: 'backend_changed' (backend_name, model_path),
+                'fallback_triggered' (from_backend, to_backend, error) or
+                'loading_progress' (message, progress)
+            callback: Function called with the event's arguments
+        """
+        self._listeners[event] = self._listeners.get(event, ()) + (callback,)
+    
+    def _emit(self, event: str, *args):
+        """Call every callback registered for an event."""
+        for callback in self._listeners.get(event, ()):
+            callback(*args)
+    
+    # Single-callback attributes, kept for existing callers; assigning one
+    # replaces all callbacks for its event
+    on_backend_changed = _callback_property('backend_changed')
+    on_fallback_triggered = _callback_property('fallback_triggered')
+    on_loading_progress = _callback_property('loading_progress')
+    
+    def _ensure_ready(self):
+        """Register backends, initialize configs and detect availability once."""
+        if self._ready:
+            return
+        
+        with self._ready_lock:
+            if self._ready:
+                return
+            
+            self._ensure_backends_registered()
+            self._initialize_configs()
+            self._detect_available_backends()
+            self._ready = True
     
     def _ensure_backends_registered(self):
         """Ensure all backends are registered with the registry."""
@@ -113,6 +192,10 @@ class BackendManager:
         default_configs = self.registry.get_default_configs()
         
         for backend_name, config in default_configs.items():
+            # Keep configs callers set before the manager was first used
+            if backend_name in self._configs:
+                continue
+            
             # Get optimal settings based on hardware
             hw_info = self.hardware_detector.get_hardware_info()
             optimal_settings = self.hardware_detector.get_optimal_settings(backend_name, 4096)  # Assume 4GB model
@@ -124,26 +207,39 @@ class BackendManager:
             config.batch_size = optimal_settings.get('batch_size', 512)
             config.threads = optimal_settings.get('threads', -1)
             
-            self.configs[backend_name] = config
+            self._configs[backend_name] = config
             self.logger.info(f"Initialized config for {backend_name}: GPU={config.gpu_enabled}, Layers={config.gpu_layers}")
     
     def _detect_available_backends(self):
-        """Detect which backends are available on the system."""
-        available_backends = self.registry.list_available_backends()
-        
-        for backend_type, is_available, error_message in available_backends:
-            status = BackendStatus(
-                name=backend_type.value,
-                available=is_available,
-                error_message=error_message,
-                last_checked=time.time()
-            )
-            self.backend_status[backend_type.value] = status
-            
-            if is_available:
-                self.logger.info(f"Backend available: {backend_type.value}")
-            else:
-                self.logger.warning(f"Backend unavailable: {backend_type.value} - {error_message}")
+        """
+        Detect which backends are available on the system.
+        
+        Each probe imports (and may load) a separate library, so they run
+        concurrently and detection takes as long as the slowest probe.
+        """
+        backend_names = list(self.registry.backends)
+        if not backend_names:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(backend_names),
+                                thread_name_prefix="backend-probe") as executor:
+            # map() keeps registration order, which backend selection relies on
+            statuses = list(executor.map(self._probe_backend, backend_names))
+        
+        for status in statuses:
+            self.backend_status[status.name] = status
+    
+    def _probe_backend(self, backend_name: str) -> BackendStatus:
+        """Check a single backend's availability and build its status."""
+        backend_type, is_available, error_message = self.registry.check_backend_availability(backend_name)
+        
+        if is_available:
+            self.logger.info(f"Backend available: {backend_type.value}")
+        else:
+            self.logger.warning(f"Backend unavailable: {backend_type.value} - {error_message}")
+        
+        # Positional: this runs once per registered backend on every probe
+        return BackendStatus(backend_type.value, is_available, error_message, time.time())
     
     def get_available_backends(self) -> List[str]:
         """
@@ -152,8 +248,21 @@ class BackendManager:
         Returns:
             List of available backend names
         """
+        self._ensure_ready()
+        
+        # Read from the statuses on every call: they are updated in place
         return [name for name, status in self.backend_status.items() if status.available]
     
+    @property
+    def configs(self) -> Dict[str, BackendConfig]:
+        """Configuration for each backend, by name (defaults filled on first access)."""
+        self._ensure_ready()
+        return self._configs
+    
+    @configs.setter
+    def configs(self, value: Dict[str, BackendConfig]):
+        self._configs = value
+    
     def get_backend_status(self, backend_name: str) -> Optional[BackendStatus]:
         """
         Get status for a specific backend.
@@ -164,15 +273,17 @@ class BackendManager:
         Returns:
             BackendStatus object or None if not found
         """
+        self._ensure_ready()
         return self.backend_status.get(backend_name)
     
-    def get_best_backend(self, model_size_mb: int = 4096, hardware_preference: str = 'auto') -> Optional[str]:
+    def get_best_backend(self, model_size_mb: int = 4096,
+                         hardware_preference: Union[str, HardwarePreference] = 'auto') -> Optional[str]:
         """
         Get the best available backend for the given requirements.
         
         Args:
             model_size_mb: Size of the model in MB
-            hardware_preference: Hardware preference ('auto', 'gpu', 'cpu')
+            hardware_preference: HardwarePreference or its value ('auto', 'gpu', 'cpu')
             
         Returns:
             Best backend name or None if none available
@@ -181,17 +292,33 @@ class BackendManager:
         if not available_backends:
             return None
         
+        try:
+            preference = HardwarePreference(hardware_preference)
+        except ValueError:
+            # Unknown preferences have always meant automatic selection
+            preference = HardwarePreference.AUTO
+        
         # Get hardware info for decision making
-        hw_info = self.hardware_detector.get_hardware_info()
+        hw_info = self._cached_hardware_info()
+        
+        # Find the first available backend in preferred order
+        for backend_name in self._ranked_backends(preference, hw_info, available_backends):
+            # Check if backend can handle the model size
+            if self._can_handle_model_size(backend_name, model_size_mb):
+                return backend_name
         
+        # Fallback to any available backend
+        return available_backends[0]
+    
+    def _ranked_backends(self, hardware_preference: HardwarePreference, hw_info: HardwareInfo,
+                         available_backends: List[str]) -> Tuple[str, ...]:
+        """Get the available backends in order of preference."""
         # If hardware preference is specified, filter accordingly
-        if hardware_preference == 'cpu':
-            # Prefer backends that work well on CPU
-            preferred_order = [BackendType.LLAMAFILE.value, BackendType.CTRANSFORMERS.value]
-        elif hardware_preference == 'gpu':
-            # Prefer GPU-accelerated backends
+        if hardware_preference is HardwarePreference.CPU:
+            preferred_order = self.PREFERRED_BACKENDS[HardwarePreference.CPU]
+        elif hardware_preference is HardwarePreference.GPU:
             if hw_info.gpu_count > 0:
-                preferred_order = [BackendType.CTRANSFORMERS.value, BackendType.TRANSFORMERS.value]
+                preferred_order = self.PREFERRED_BACKENDS[HardwarePreference.GPU]
             else:
                 self.logger.warning("GPU preference specified but no GPUs detected")
                 preferred_order = self.fallback_order
@@ -204,36 +331,58 @@ class BackendManager:
             else:
                 preferred_order = self.fallback_order
         
-        # Find the first available backend in preferred order
-        for backend_name in preferred_order:
-            if backend_name in available_backends:
-                # Check if backend can handle the model size
-                if self._can_handle_model_size(backend_name, model_size_mb):
-                    return backend_name
-        
-        # Fallback to any available backend
-        return available_backends[0] if available_backends else None
+        return tuple(b for b in preferred_order if b in available_backends)
     
     def _can_handle_model_size(self, backend_name: str, model_size_mb: int) -> bool:
         """Check if a backend can handle a model of the given size."""
-        hw_info = self.hardware_detector.get_hardware_info()
+        ram_budget_mb, vram_budget_mb = self._memory_budgets()
         
         # Estimate memory requirements (model size + overhead)
         estimated_memory_mb = int(model_size_mb * 1.5)  # 50% overhead
         
         # Check if we have enough system RAM
-        if estimated_memory_mb > hw_info.total_ram * 0.8:  # Don't use more than 80% of RAM
+        if estimated_memory_mb > ram_budget_mb:
             return False
         
         # For GPU backends, check VRAM
-        config = self.configs.get(backend_name)
-        if config and config.gpu_enabled and hw_info.total_vram > 0:
-            if estimated_memory_mb > hw_info.total_vram * 0.9:  # Don't use more than 90% of VRAM
+        if vram_budget_mb is not None and estimated_memory_mb > vram_budget_mb:
+            config = self.configs.get(backend_name)
+            if config and config.gpu_enabled:
                 # Can still work in CPU mode
                 self.logger.info(f"Model too large for GPU, will use CPU mode for {backend_name}")
         
         return True
     
+    def _memory_budgets(self) -> Tuple[float, Optional[float]]:
+        """
+        Get the RAM and VRAM (None without a GPU) a model may use, in MB.
+        
+        Computed once per hardware info result rather than on every size check.
+        """
+        hw_info = self._cached_hardware_info()
+        if hw_info is not self._budgets_hw_info:
+            self._budgets = (
+                hw_info.total_ram * 0.8,  # Don't use more than 80% of RAM
+                hw_info.total_vram * 0.9 if hw_info.total_vram > 0 else None  # or 90% of VRAM
+            )
+            self._budgets_hw_info = hw_info
+        
+        return self._budgets
+    
+    def _cached_hardware_info(self) -> HardwareInfo:
+        """
+        Get hardware info for backend selection.
+        
+        Detection runs at most once every HARDWARE_INFO_TTL seconds, so the
+        repeated size checks of a single load share one result.
+        """
+        now = time.monotonic()
+        if self._hw_info_cache is None or now - self._hw_info_cached_at > self.HARDWARE_INFO_TTL:
+            self._hw_info_cache = self.hardware_detector.get_hardware_info()
+            self._hw_info_cached_at = now
+        
+        return self._hw_info_cache
+    
     def load_model(self, model_path: str, backend_name: Optional[str] = None, **kwargs) -> LoadingResult:
         """
         Load a model using the specified or best available backend.
@@ -246,8 +395,13 @@ class BackendManager:
         Returns:
             LoadingResult with success status and details
         """
-        # Validate model path
-        if not Path(model_path).exists():
+        self._ensure_ready()
+        
+        # Validate model path and get model size for backend selection
+        # (a single stat call covers both)
+        try:
+            model_size_mb = os.stat(model_path).st_size // (1024 * 1024)
+        except OSError:
             return LoadingResult(
                 success=False,
                 backend_used="none",
@@ -256,9 +410,6 @@ class BackendManager:
                 error_message=f"Model file does not exist: {model_path}"
             )
         
-        # Get model size for backend selection
-        model_size_mb = Path(model_path).stat().st_size // (1024 * 1024)
-        
         # Determine which backend to use
         if backend_name:
             if backend_name not in self.get_available_backends():
@@ -269,11 +420,11 @@ class BackendManager:
                     load_time=0.0,
                     error_message=f"Requested backend not available: {backend_name}"
                 )
-            backends_to_try = [backend_name]
+            backends_to_try = (backend_name,)
         else:
             # Auto-select best backend and create fallback chain
-            best_backend = self.get_best_backend(model_size_mb)
-            if not best_backend:
+            backends_to_try = self._eligible_backends(model_size_mb)
+            if not backends_to_try:
                 return LoadingResult(
                     success=False,
                     backend_used="none",
@@ -281,10 +432,6 @@ class BackendManager:
                     load_time=0.0,
                     error_message="No backends available"
                 )
-            
-            # Create fallback chain starting with best backend
-            available = self.get_available_backends()
-            backends_to_try = [best_backend] + [b for b in self.fallback_order if b in available and b != best_backend]
         
         # Try backends in order until one succeeds
         last_error = None
@@ -301,8 +448,7 @@ class BackendManager:
                 )
                 
                 # Update progress callback
-                if self.on_loading_progress:
-                    self.on_loading_progress(f"Trying {backend_name}...", 10)
+                self._emit('loading_progress', f"Trying {backend_name}...", 10)
                 
                 # Get or create backend instance
                 backend = self._get_backend_instance(backend_name)
@@ -332,8 +478,7 @@ class BackendManager:
                     self.current_model_path = model_path
                     
                     # Notify about backend change
-                    if self.on_backend_changed:
-                        self.on_backend_changed(backend_name, model_path)
+                    self._emit('backend_changed', backend_name, model_path)
                     
                     log_performance(
                         self.logger, backend_name, "load", load_time * 1000,
@@ -359,9 +504,9 @@ class BackendManager:
                     )
                     
                     # Notify about fallback
-                    if len(backends_to_try) > 1 and self.on_fallback_triggered:
+                    if len(backends_to_try) > 1:
                         next_backend = backends_to_try[backends_to_try.index(backend_name) + 1] if backends_to_try.index(backend_name) + 1 < len(backends_to_try) else "none"
-                        self.on_fallback_triggered(backend_name, next_backend, result.error_message)
+                        self._emit('fallback_triggered', backend_name, next_backend, result.error_message)
             
             except Exception as e:
                 # Unexpected error with this backend
@@ -388,14 +533,44 @@ class BackendManager:
             error_message=f"All backends failed. Last error: {last_error}"
         )
     
+    def _eligible_backends(self, model_size_mb: int,
+                           hardware_preference: Union[str, HardwarePreference] = 'auto') -> Tuple[str, ...]:
+        """
+        Get the backends to try for a model, in order.
+        
+        The best backend comes first, followed by the other available
+        backends in fallback order. Only these are ever instantiated by
+        load_model.
+        """
+        best_backend = self.get_best_backend(model_size_mb, hardware_preference)
+        if not best_backend:
+            return ()
+        
+        available = frozenset(self.get_available_backends())
+        return (best_backend,) + tuple(
+            b for b in self.fallback_order if b in available and b != best_backend
+        )
+    
     def _get_backend_instance(self, backend_name: str) -> ModelBackend:
-        """Get or create a backend instance."""
-        if backend_name not in self.backends:
-            config = self.configs[backend_name]
-            backend_type = BackendType(backend_name)
-            self.backends[backend_name] = self.registry.get_backend(backend_type, config)
+        """
+        Get or create a backend instance.
         
-        return self.backends[backend_name]
+        Instances are cached and reused across loads and fallbacks until
+        availability is refreshed or the manager is cleaned up.
+        """
+        self._ensure_ready()
+        
+        backend = self.backends.get(backend_name)
+        if backend is None:
+            with self._backends_lock:
+                backend = self.backends.get(backend_name)
+                if backend is None:
+                    config = self.configs[backend_name]
+                    backend_type = BackendType(backend_name)
+                    backend = self.registry.get_backend(backend_type, config)
+                    self.backends[backend_name] = backend
+        
+        return backend
     
     def generate_text(self, prompt: str, config: GenerationConfig) -> str:
         """
@@ -414,24 +589,25 @@ class BackendManager:
         if not self.current_backend:
             raise ModelLoadingError("No model is currently loaded")
         
-        # Start performance monitoring
+        # Monitor the generation as a single operation
         backend_name = self.current_backend.config.name
-        operation_id = self.performance_monitor.start_operation(
+        with self.performance_monitor.record_operation(
             backend_name, "generate", self.current_model_path
-        )
-        
-        try:
-            start_time = time.time()
-            result = self.current_backend.generate_text(prompt, config)
-            duration = time.time() - start_time
+        ) as record:
+            try:
+                start_time = time.time()
+                result = self.current_backend.generate_text(prompt, config)
+                duration = time.time() - start_time
+            except Exception as e:
+                log_performance(
+                    self.logger, backend_name, "generate", 0,
+                    success=False, error_message=str(e)
+                )
+                raise
             
             # Estimate tokens generated (rough approximation)
             tokens_generated = len(result.split()) if result else 0
-            
-            # End performance monitoring
-            self.performance_monitor.end_operation(
-                operation_id, True, tokens_generated=tokens_generated
-            )
+            record['tokens_generated'] = tokens_generated
             
             log_performance(
                 self.logger, backend_name, "generate", duration * 1000,
@@ -439,17 +615,6 @@ class BackendManager:
             )
             
             return result
-            
-        except Exception as e:
-            # End performance monitoring with error
-            self.performance_monitor.end_operation(operation_id, False, str(e))
-            
-            log_performance(
-                self.logger, backend_name, "generate", 0,
-                success=False, error_message=str(e)
-            )
-            
-            raise
     
     def unload_model(self) -> bool:
         """
@@ -465,32 +630,38 @@ class BackendManager:
         if self.current_backend:
             backend_name = self.current_backend.config.name
             
-            # Start performance monitoring
-            operation_id = self.performance_monitor.start_operation(
+            # Monitor the unload as a single operation
+            with self.performance_monitor.record_operation(
                 backend_name, "unload", self.current_model_path
-            )
-            
-            try:
+            ) as record:
                 start_time = time.time()
-                success = self.current_backend.unload_model()
+                try:
+                    success = self.current_backend.unload_model()
+                except Exception as e:
+                    duration = time.time() - start_time
+                    record['success'] = False
+                    record['error_message'] = str(e)
+                    
+                    log_performance(
+                        self.logger, backend_name, "unload", duration * 1000,
+                        success=False, error_message=str(e)
+                    )
+                    
+                    return False
+                
                 duration = time.time() - start_time
                 
                 if success:
                     self.current_backend = None
                     self.current_model_path = None
                     
-                    # End performance monitoring
-                    self.performance_monitor.end_operation(operation_id, True)
-                    
                     log_performance(
                         self.logger, backend_name, "unload", duration * 1000,
                         success=True
                     )
                 else:
-                    # End performance monitoring with failure
-                    self.performance_monitor.end_operation(
-                        operation_id, False, "Unload operation returned False"
-                    )
+                    record['success'] = False
+                    record['error_message'] = "Unload operation returned False"
                     
                     log_performance(
                         self.logger, backend_name, "unload", duration * 1000,
@@ -498,19 +669,6 @@ class BackendManager:
                     )
                 
                 return success
-                
-            except Exception as e:
-                duration = time.time() - start_time if 'start_time' in locals() else 0
-                
-                # End performance monitoring with error
-                self.performance_monitor.end_operation(operation_id, False, str(e))
-                
-                log_performance(
-                    self.logger, backend_name, "unload", duration * 1000,
-                    success=False, error_message=str(e)
-                )
-                
-                return False
         return True
     
     def switch_backend(self, backend_name: str, reload_model: bool = True) -> bool:
@@ -550,20 +708,35 @@ class BackendManager:
         return self.current_backend.get_model_info()
     
     def get_hardware_info(self) -> HardwareInfo:
-        """Get current hardware information."""
-        return self.hardware_detector.get_hardware_info()
+        """
+        Get current hardware information.
+        
+        Shares the selection cache, so detection runs at most once every
+        HARDWARE_INFO_TTL seconds; refresh_backend_availability() clears it.
+        """
+        return self._cached_hardware_info()
     
     def refresh_backend_availability(self):
         """Refresh the availability status of all backends."""
         self.logger.info("Refreshing backend availability...")
-        self._detect_available_backends()
+        self._hw_info_cache = None
+        
+        # Rebuild backend instances on next use; the current backend keeps
+        # its loaded model
+        self.backends = {
+            name: backend for name, backend in self.backends.items()
+            if backend is self.current_backend
+        }
+        
+        if self._ready:
+            self._detect_available_backends()
+        else:
+            self._ensure_ready()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get usage statistics for all backends."""
-        stats = {}
-        
-        for name, status in self.backend_status.items():
-            stats[name] = {
+        return {
+            name: {
                 'available': status.available,
                 'load_attempts': status.load_attempts,
                 'success_count': status.success_count,
@@ -572,8 +745,8 @@ class BackendManager:
                 'average_load_time': status.average_load_time,
                 'last_checked': status.last_checked
             }
-        
-        return stats
+            for name, status in self.backend_status.items()
+        }
     
     def get_monitoring_report(self) -> Dict[str, Any]:
         """Get comprehensive monitoring report."""
@@ -105,14 +105,12 @@ class EnhancedBackendManager(BackendManager):
                 
                 if is_fallback:
                     self.logger.info(f"Attempting fallback to backend: {backend_name}")
-                    if self.on_fallback_triggered:
-                        prev_backend = backends_to_try[i-1]
-                        self.on_fallback_triggered(prev_backend, backend_name, "Primary backend failed")
+                    prev_backend = backends_to_try[i-1]
+                    self._emit('fallback_triggered', prev_backend, backend_name, "Primary backend failed")
                 
                 # Update progress
-                if self.on_loading_progress:
-                    progress = 20 + (i * 60 // len(backends_to_try))
-                    self.on_loading_progress(f"Trying {backend_name}...", progress)
+                progress = 20 + (i * 60 // len(backends_to_try))
+                self._emit('loading_progress', f"Trying {backend_name}...", progress)
                 
                 # Attempt to load with this backend
                 attempt_start = time.time()
@@ -270,8 +268,7 @@ class EnhancedBackendManager(BackendManager):
                 self.current_model_path = model_path
                 
                 # Notify about backend change
-                if self.on_backend_changed:
-                    self.on_backend_changed(backend_name, model_path)
+                self._emit('backend_changed', backend_name, model_path)
             else:
                 status.failure_count += 1
             
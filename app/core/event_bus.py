@@ -357,6 +357,23 @@ class EventBus:
             wildcard_count = sum(len(subscribers) for subscribers in self.wildcard_subscribers.values())
             return direct_count + wildcard_count
     
+    def snapshot_subscriber_counts(self) -> Dict[str, int]:
+        """
+        Get subscriber counts for all events in a single pass.
+        
+        Wildcard subscriptions are reported under their pattern (e.g.
+        "model.*") and are not expanded into the events they match; use
+        get_subscriber_count() for that.
+        
+        Returns:
+            Dictionary of event name or pattern -> number of subscribers
+        """
+        counts = {name: len(subscribers) for name, subscribers in self.subscribers.items()}
+        counts.update(
+            (pattern, len(subscribers)) for pattern, subscribers in self.wildcard_subscribers.items()
+        )
+        return counts
+    
     def subscribe_to_universal_events(self, subscriber_id: str, callback: Callable, 
                                     event_patterns: List[str] = None) -> List[str]:
         """
@@ -453,6 +470,16 @@ class EventBus:
         
         return stats
 
+    def reset(self):
+        """
+        Remove all subscriptions while keeping the async worker running.
+        
+        This lets a single bus be reused by independent components (for
+        example across test cases) without restarting its thread.
+        """
+        self.subscribers.clear()
+        self.wildcard_subscribers.clear()
+    
     def shutdown(self):
         """Shut down the event bus and stop the async thread."""
         self.logger.info("Shutting down event bus")
@@ -34,6 +34,13 @@ class HardwareType(Enum):
     MPS = "mps"  # Apple Metal Performance Shaders
 
 
+class HardwarePreference(Enum):
+    """Hardware preference for backend selection."""
+    AUTO = "auto"
+    GPU = "gpu"
+    CPU = "cpu"
+
+
 @dataclass
 class BackendConfig:
     """Configuration for a specific backend."""
@@ -354,19 +361,26 @@ class BackendRegistry:
         Returns:
             List of tuples (backend_type, is_available, error_message)
         """
-        available_backends = []
-        
-        for backend_name, backend_class in self.backends.items():
-            try:
-                # Create a temporary config for availability check
-                temp_config = BackendConfig(name=backend_name)
-                backend = backend_class(temp_config)
-                is_available, error = backend.is_available()
-                available_backends.append((BackendType(backend_name), is_available, error))
-            except Exception as e:
-                available_backends.append((BackendType(backend_name), False, str(e)))
+        return [self.check_backend_availability(name) for name in list(self.backends)]
+    
+    def check_backend_availability(self, backend_name: str) -> Tuple[BackendType, bool, Optional[str]]:
+        """
+        Check whether a single registered backend is available.
         
-        return available_backends
+        Args:
+            backend_name: Name of the registered backend
+            
+        Returns:
+            Tuple (backend_type, is_available, error_message)
+        """
+        try:
+            # Create a temporary config for availability check
+            temp_config = BackendConfig(name=backend_name)
+            backend = self.backends[backend_name](temp_config)
+            is_available, error = backend.is_available()
+            return BackendType(backend_name), is_available, error
+        except Exception as e:
+            return BackendType(backend_name), False, str(e)
     
     def get_default_configs(self) -> Dict[str, BackendConfig]:
         """Get default configurations for all registered backends."""
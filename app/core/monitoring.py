@@ -21,6 +21,8 @@ from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from collections import deque, defaultdict
+from itertools import islice
+from contextlib import contextmanager
 import subprocess
 import platform
 
@@ -292,13 +294,7 @@ class PerformanceMonitor:
         operation_id = f"{backend_name}_{operation}_{time.time()}"
         
         # Store operation start info
-        setattr(self, f"_op_{operation_id}", {
-            'backend_name': backend_name,
-            'operation': operation,
-            'start_time': time.time(),
-            'model_path': model_path,
-            'model_size_mb': self._get_model_size(model_path) if model_path else None
-        })
+        setattr(self, f"_op_{operation_id}", self._begin_operation(backend_name, operation, model_path))
         
         return operation_id
     
@@ -328,6 +324,52 @@ class PerformanceMonitor:
         # Clean up operation info
         delattr(self, f"_op_{operation_id}")
         
+        return self._finish_operation(op_info, end_time, success, error_message, tokens_generated)
+    
+    @contextmanager
+    def record_operation(self, backend_name: str, operation: str,
+                         model_path: Optional[str] = None):
+        """
+        Monitor an operation for the duration of a ``with`` block.
+        
+        Equivalent to start_operation/end_operation, but records a single
+        metrics entry on exit. The yielded dict can be updated with
+        'success', 'error_message' and 'tokens_generated'; an exception
+        escaping the block is recorded as a failure.
+        
+        Args:
+            backend_name: Name of the backend
+            operation: Type of operation ('load', 'generate', 'unload')
+            model_path: Path to model file (if applicable)
+        """
+        op_info = self._begin_operation(backend_name, operation, model_path)
+        record = {'success': True, 'error_message': None, 'tokens_generated': None}
+        
+        try:
+            yield record
+        except Exception as e:
+            record['success'] = False
+            record['error_message'] = record['error_message'] or str(e)
+            raise
+        finally:
+            self._finish_operation(op_info, time.time(), record['success'],
+                                   record['error_message'], record['tokens_generated'])
+    
+    def _begin_operation(self, backend_name: str, operation: str,
+                         model_path: Optional[str]) -> Dict[str, Any]:
+        """Build the start info for an operation (see _finish_operation)."""
+        return {
+            'backend_name': backend_name,
+            'operation': operation,
+            'start_time': time.time(),
+            'model_path': model_path,
+            'model_size_mb': self._get_model_size(model_path) if model_path else None
+        }
+    
+    def _finish_operation(self, op_info: Dict[str, Any], end_time: float, success: bool,
+                          error_message: Optional[str],
+                          tokens_generated: Optional[int]) -> PerformanceMetrics:
+        """Build and record the metrics for a finished operation."""
         # Calculate metrics
         start_time = op_info['start_time']
         duration = end_time - start_time
@@ -427,17 +469,20 @@ class PerformanceMonitor:
             List of PerformanceMetrics
         """
         with self._lock:
-            metrics = list(self.metrics_history)
-            
-            # Apply filters
-            if backend_name:
-                metrics = [m for m in metrics if m.backend_name == backend_name]
-            
-            if operation:
-                metrics = [m for m in metrics if m.operation == operation]
-            
-            # Return most recent
-            return metrics[-count:] if count > 0 else metrics
+            # Walk back from the newest entry so only the requested metrics
+            # are copied, not the whole history
+            metrics = (
+                m for m in reversed(self.metrics_history)
+                if (not backend_name or m.backend_name == backend_name)
+                and (not operation or m.operation == operation)
+            )
+            if count > 0:
+                metrics = islice(metrics, count)
+            recent = list(metrics)
+        
+        # Return most recent, oldest first
+        recent.reverse()
+        return recent
 
 
 class SystemMonitor:
@@ -479,11 +479,6 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 self.logger.warning(f"Failed to restore window geometry: {e}")
     
-    def _save_window_state(self):
-        """Save window state to configuration."""
-        geometry = self.saveGeometry().toHex().data().decode()
-        self.config_manager.set_value("window.geometry", geometry)
-    
     def _update_recent_models_menu(self):
         """Update the recent models menu."""
         self.recent_models_menu.clear()
@@ -2,19 +2,19 @@
 Pytest configuration and fixtures for backend testing.
 
 This module provides common fixtures and configuration for all backend tests.
+
+Tests that use the ``large_mock_model_file`` fixture (a 100MB file) are
+deselected by default; pass ``--run-slow`` to include them.
 """
 
-import os
-import sys
 import tempfile
+import importlib.util
 import pytest
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import Mock, MagicMock
 from typing import Dict, Any, List
 
-# Add the app directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
-
 # Import core modules
 from core.model_backends import (
     BackendConfig, BackendType, HardwareInfo, LoadingResult, 
@@ -24,6 +24,164 @@ from core.hardware_detector import HardwareDetector, GPUDevice
 from core.backend_manager import BackendManager
 
 
+# Minimal GGUF-like file: magic number, padding to 1KB, then some content
+_MOCK_MODEL_BYTES = b'GGUF' + bytes(1020) + b'test model data' * 100
+
+# Canonical hardware descriptions, built once at import time. GPU entries
+# are read-only mappings; fixtures hand out these shared instances.
+_MOCK_GPU_DEVICE = GPUDevice(
+    id=0,
+    name="Test GPU",
+    vendor="nvidia",
+    memory_mb=8192,
+    driver_version="11.8",
+    compute_capability="8.6",
+    supports_cuda=True,
+    supports_rocm=False,
+    supports_opencl=True,
+    supports_vulkan=True,
+    supports_metal=False
+)
+
+_GPU_FIELDS = (
+    'id', 'name', 'vendor', 'memory_mb', 'driver_version', 'compute_capability',
+    'supports_cuda', 'supports_rocm', 'supports_opencl', 'supports_vulkan', 'supports_metal'
+)
+
+
+def _gpu(values) -> MappingProxyType:
+    """Build a read-only GPU entry from values ordered as _GPU_FIELDS."""
+    return MappingProxyType(dict(zip(_GPU_FIELDS, values)))
+
+
+_GPU_NVIDIA = _gpu(getattr(_MOCK_GPU_DEVICE, field) for field in _GPU_FIELDS)
+
+_GPU_AMD = _gpu((
+    0, "AMD Radeon RX 7900 XTX", "amd", 24576, "23.11.1", None,
+    False, True, True, True, False
+))
+
+_GPU_RTX_4090_0 = _gpu((
+    0, "NVIDIA RTX 4090", "nvidia", 24576, "535.98", "8.9",
+    True, False, True, True, False
+))
+
+# Second card differs from the first only by id; share everything else
+_GPU_RTX_4090_1 = MappingProxyType({**_GPU_RTX_4090_0, 'id': 1})
+
+_HW_INFO_SINGLE = HardwareInfo(
+    gpu_count=1,
+    gpu_devices=[_GPU_NVIDIA],
+    total_vram=8192,
+    cpu_cores=8,
+    total_ram=16384,
+    recommended_backend="ctransformers",
+    supported_hardware=[HardwareType.CPU, HardwareType.CUDA, HardwareType.OPENCL]
+)
+
+_HW_INFO_CPU_ONLY = HardwareInfo(
+    gpu_count=0,
+    gpu_devices=[],
+    total_vram=0,
+    cpu_cores=4,
+    total_ram=8192,
+    recommended_backend="llamafile",
+    supported_hardware=[HardwareType.CPU]
+)
+
+_HW_INFO_AMD = HardwareInfo(
+    gpu_count=1,
+    gpu_devices=[_GPU_AMD],
+    total_vram=24576,
+    cpu_cores=16,
+    total_ram=32768,
+    recommended_backend="ctransformers",
+    supported_hardware=[HardwareType.CPU, HardwareType.ROCM, HardwareType.OPENCL, HardwareType.VULKAN]
+)
+
+_HW_INFO_MULTI_GPU = HardwareInfo(
+    gpu_count=2,
+    gpu_devices=[_GPU_RTX_4090_0, _GPU_RTX_4090_1],
+    total_vram=49152,
+    cpu_cores=24,
+    total_ram=65536,
+    recommended_backend="ctransformers",
+    supported_hardware=[HardwareType.CPU, HardwareType.CUDA, HardwareType.OPENCL, HardwareType.VULKAN]
+)
+
+# Import the Qt-backed application modules once, before test collection,
+# so every test module resolves them straight from sys.modules.
+if importlib.util.find_spec("PySide6") is not None:
+    import app.core.event_bus
+    import app.core.model_service
+    import app.models.gguf_model
+
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run slow tests, including those using large_mock_model_file"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests that need the large mock model file unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    
+    selected = []
+    deselected = []
+    for item in items:
+        if "large_mock_model_file" in getattr(item, "fixturenames", ()):
+            deselected.append(item)
+        else:
+            selected.append(item)
+    
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qt_app(request):
+    """
+    Create the Qt application once for the whole test session.
+    
+    When any collected test uses pytest-qt's ``qapp`` fixture, the
+    QApplication it creates is shared; otherwise a lightweight
+    QCoreApplication is enough for the non-widget tests.
+    """
+    try:
+        from PySide6.QtCore import QCoreApplication
+    except ImportError:
+        yield None
+        return
+    
+    if any("qapp" in getattr(item, "fixturenames", ()) for item in request.session.items):
+        yield request.getfixturevalue("qapp")
+        return
+    
+    yield QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture(scope="session")
+def shared_event_bus():
+    """
+    Create one EventBus for the whole session.
+    
+    Tests should call ``reset()`` before use to drop subscriptions left by
+    earlier tests; the bus is shut down once at session end.
+    """
+    from app.core.event_bus import EventBus
+    
+    event_bus = EventBus()
+    yield event_bus
+    event_bus.shutdown()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -31,36 +189,53 @@ def temp_dir():
         yield Path(tmp_dir)
 
 
-@pytest.fixture
-def mock_model_file(temp_dir):
-    """Create a mock GGUF model file for testing."""
-    model_path = temp_dir / "test_model.gguf"
+@pytest.fixture(scope="session")
+def session_temp_dir(tmp_path_factory):
+    """
+    Create a temporary directory shared by all tests in the session.
+    
+    Built on tmp_path_factory, so each pytest-xdist worker gets its own.
+    """
+    return tmp_path_factory.mktemp("session")
+
+
+@pytest.fixture(scope="session")
+def mock_model_file(session_temp_dir):
+    """Create a mock GGUF model file for testing (shared, read-only)."""
+    model_path = session_temp_dir / "test_model.gguf"
     
     # Create a minimal GGUF-like file with header
-    with open(model_path, 'wb') as f:
-        f.write(b'GGUF')  # GGUF magic number
-        f.write(b'\x00' * 1020)  # Padding to make it 1KB
-        f.write(b'test model data' * 100)  # Some content
+    model_path.write_bytes(_MOCK_MODEL_BYTES)
     
     return model_path
 
 
-@pytest.fixture
-def large_mock_model_file(temp_dir):
-    """Create a large mock model file for testing memory scenarios."""
-    model_path = temp_dir / "large_model.gguf"
+@pytest.fixture(scope="session")
+def large_mock_model_file(session_temp_dir):
+    """
+    Create a large mock model file for testing memory scenarios (shared, read-only).
     
-    # Create a 100MB mock file
+    Tests using this fixture only run with --run-slow.
+    """
+    model_path = session_temp_dir / "large_model.gguf"
+    
+    # Create a 100MB mock file. The file is sparse; readers (including
+    # mmap) still see zero bytes after the magic number.
     with open(model_path, 'wb') as f:
         f.write(b'GGUF')  # GGUF magic number
-        f.write(b'\x00' * (100 * 1024 * 1024 - 4))  # 100MB - 4 bytes
+        f.truncate(100 * 1024 * 1024)
     
     return model_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def backend_config():
-    """Create a default backend configuration."""
+    """
+    Create a default backend configuration.
+    
+    Shared across the session; use dataclasses.replace() for variants
+    instead of mutating it.
+    """
     return BackendConfig(
         name="test_backend",
         enabled=True,
@@ -72,9 +247,14 @@ def backend_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generation_config():
-    """Create a default generation configuration."""
+    """
+    Create a default generation configuration.
+    
+    Shared across the session; use dataclasses.replace() for variants
+    instead of mutating it.
+    """
     return GenerationConfig(
         max_tokens=256,
         temperature=0.7,
@@ -87,167 +267,97 @@ def generation_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_gpu_device():
-    """Create a mock GPU device."""
-    return GPUDevice(
-        id=0,
-        name="Test GPU",
-        vendor="nvidia",
-        memory_mb=8192,
-        driver_version="11.8",
-        compute_capability="8.6",
-        supports_cuda=True,
-        supports_rocm=False,
-        supports_opencl=True,
-        supports_vulkan=True,
-        supports_metal=False
-    )
+    """Create a mock GPU device. Shared across the session; do not mutate."""
+    return _MOCK_GPU_DEVICE
 
 
-@pytest.fixture
-def mock_hardware_info(mock_gpu_device):
-    """Create mock hardware information."""
-    return HardwareInfo(
-        gpu_count=1,
-        gpu_devices=[{
-            'id': mock_gpu_device.id,
-            'name': mock_gpu_device.name,
-            'vendor': mock_gpu_device.vendor,
-            'memory_mb': mock_gpu_device.memory_mb,
-            'driver_version': mock_gpu_device.driver_version,
-            'compute_capability': mock_gpu_device.compute_capability,
-            'supports_cuda': mock_gpu_device.supports_cuda,
-            'supports_rocm': mock_gpu_device.supports_rocm,
-            'supports_opencl': mock_gpu_device.supports_opencl,
-            'supports_vulkan': mock_gpu_device.supports_vulkan,
-            'supports_metal': mock_gpu_device.supports_metal
-        }],
-        total_vram=8192,
-        cpu_cores=8,
-        total_ram=16384,
-        recommended_backend="ctransformers",
-        supported_hardware=[HardwareType.CPU, HardwareType.CUDA, HardwareType.OPENCL]
-    )
+@pytest.fixture(scope="session")
+def mock_hardware_info():
+    """Create mock hardware information. Shared across the session; do not mutate."""
+    return _HW_INFO_SINGLE
 
 
-@pytest.fixture
+class _StubHardwareDetector:
+    """
+    Lightweight stand-in for HardwareDetector.
+    
+    Every method returns a canned value, avoiding the cost of building a
+    Mock with spec=HardwareDetector. Tests that need call tracking can wrap
+    a method on demand, e.g. Mock(wraps=detector.get_hardware_info).
+    """
+    
+    def __init__(self, hardware_info: HardwareInfo, gpu_device: GPUDevice):
+        self._hardware_info = hardware_info
+        self._gpu_device = gpu_device
+    
+    def detect_gpus(self) -> List[GPUDevice]:
+        return [self._gpu_device]
+    
+    def detect_cpu_info(self) -> Dict[str, Any]:
+        return {
+            'cores': 8,
+            'threads': 16,
+            'frequency': 3200,
+            'architecture': 'x86_64',
+            'processor': 'Test CPU'
+        }
+    
+    def detect_system_memory(self) -> Dict[str, int]:
+        return {
+            'total': 16384,
+            'available': 12288,
+            'used': 4096,
+            'percent': 25.0
+        }
+    
+    def get_hardware_info(self) -> HardwareInfo:
+        return self._hardware_info
+    
+    def get_optimal_settings(self, backend: str, model_size_mb: int) -> Dict[str, Any]:
+        return {
+            'gpu_enabled': True,
+            'gpu_layers': -1,
+            'context_size': 4096,
+            'batch_size': 512,
+            'threads': 8
+        }
+    
+    def benchmark_backend(self, backend_name: str, model_path: str) -> Dict[str, float]:
+        return {
+            'load_time': 2.5,
+            'inference_speed': 15.2,
+            'memory_usage': 4096,
+            'tokens_per_second': 25.8
+        }
+    
+    def clear_cache(self):
+        pass
+
+
+@pytest.fixture(scope="session")
 def mock_hardware_detector(mock_hardware_info, mock_gpu_device):
-    """Create a mock hardware detector."""
-    detector = Mock(spec=HardwareDetector)
-    detector.detect_gpus.return_value = [mock_gpu_device]
-    detector.detect_cpu_info.return_value = {
-        'cores': 8,
-        'threads': 16,
-        'frequency': 3200,
-        'architecture': 'x86_64',
-        'processor': 'Test CPU'
-    }
-    detector.detect_system_memory.return_value = {
-        'total': 16384,
-        'available': 12288,
-        'used': 4096,
-        'percent': 25.0
-    }
-    detector.get_hardware_info.return_value = mock_hardware_info
-    detector.get_optimal_settings.return_value = {
-        'gpu_enabled': True,
-        'gpu_layers': -1,
-        'context_size': 4096,
-        'batch_size': 512,
-        'threads': 8
-    }
-    detector.benchmark_backend.return_value = {
-        'load_time': 2.5,
-        'inference_speed': 15.2,
-        'memory_usage': 4096,
-        'tokens_per_second': 25.8
-    }
-    return detector
+    """Create a stub hardware detector. Shared across the session; do not mutate."""
+    return _StubHardwareDetector(mock_hardware_info, mock_gpu_device)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cpu_only_hardware_info():
-    """Create hardware info for CPU-only systems."""
-    return HardwareInfo(
-        gpu_count=0,
-        gpu_devices=[],
-        total_vram=0,
-        cpu_cores=4,
-        total_ram=8192,
-        recommended_backend="llamafile",
-        supported_hardware=[HardwareType.CPU]
-    )
+    """Create hardware info for CPU-only systems. Shared across the session; do not mutate."""
+    return _HW_INFO_CPU_ONLY
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def amd_gpu_hardware_info():
-    """Create hardware info for AMD GPU systems."""
-    amd_gpu = {
-        'id': 0,
-        'name': "AMD Radeon RX 7900 XTX",
-        'vendor': "amd",
-        'memory_mb': 24576,
-        'driver_version': "23.11.1",
-        'compute_capability': None,
-        'supports_cuda': False,
-        'supports_rocm': True,
-        'supports_opencl': True,
-        'supports_vulkan': True,
-        'supports_metal': False
-    }
-    
-    return HardwareInfo(
-        gpu_count=1,
-        gpu_devices=[amd_gpu],
-        total_vram=24576,
-        cpu_cores=16,
-        total_ram=32768,
-        recommended_backend="ctransformers",
-        supported_hardware=[HardwareType.CPU, HardwareType.ROCM, HardwareType.OPENCL, HardwareType.VULKAN]
-    )
+    """Create hardware info for AMD GPU systems. Shared across the session; do not mutate."""
+    return _HW_INFO_AMD
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_gpu_hardware_info():
-    """Create hardware info for multi-GPU systems."""
-    gpu1 = {
-        'id': 0,
-        'name': "NVIDIA RTX 4090",
-        'vendor': "nvidia",
-        'memory_mb': 24576,
-        'driver_version': "535.98",
-        'compute_capability': "8.9",
-        'supports_cuda': True,
-        'supports_rocm': False,
-        'supports_opencl': True,
-        'supports_vulkan': True,
-        'supports_metal': False
-    }
-    
-    gpu2 = {
-        'id': 1,
-        'name': "NVIDIA RTX 4090",
-        'vendor': "nvidia",
-        'memory_mb': 24576,
-        'driver_version': "535.98",
-        'compute_capability': "8.9",
-        'supports_cuda': True,
-        'supports_rocm': False,
-        'supports_opencl': True,
-        'supports_vulkan': True,
-        'supports_metal': False
-    }
-    
-    return HardwareInfo(
-        gpu_count=2,
-        gpu_devices=[gpu1, gpu2],
-        total_vram=49152,
-        cpu_cores=24,
-        total_ram=65536,
-        recommended_backend="ctransformers",
-        supported_hardware=[HardwareType.CPU, HardwareType.CUDA, HardwareType.OPENCL, HardwareType.VULKAN]
-    )
+    """Create hardware info for multi-GPU systems. Shared across the session; do not mutate."""
+    return _HW_INFO_MULTI_GPU
 
 
 class MockBackend(ModelBackend):
@@ -342,21 +452,26 @@ def mock_backend_factory():
     return create_mock_backend
 
 
-@pytest.fixture
+_LARGE_PROMPT = "Create a comprehensive technical documentation for a software project that includes architecture overview, API documentation, installation instructions, usage examples, troubleshooting guide, and performance optimization tips. The documentation should be well-structured and include code examples in multiple programming languages." * 3
+
+_PERF_DATA = MappingProxyType({
+    'small_prompt': "Hello, how are you?",
+    'medium_prompt': "Write a detailed explanation of machine learning concepts including supervised learning, unsupervised learning, and reinforcement learning.",
+    'large_prompt': _LARGE_PROMPT,
+    'code_prompt': "def fibonacci(n):\n    # Complete this function to calculate fibonacci numbers",
+    'chat_prompt': "User: What is the capital of France?\nAssistant: The capital of France is Paris.\nUser: What about Germany?",
+})
+
+
+@pytest.fixture(scope="session")
 def performance_test_data():
-    """Test data for performance benchmarking."""
-    return {
-        'small_prompt': "Hello, how are you?",
-        'medium_prompt': "Write a detailed explanation of machine learning concepts including supervised learning, unsupervised learning, and reinforcement learning.",
-        'large_prompt': "Create a comprehensive technical documentation for a software project that includes architecture overview, API documentation, installation instructions, usage examples, troubleshooting guide, and performance optimization tips. The documentation should be well-structured and include code examples in multiple programming languages." * 3,
-        'code_prompt': "def fibonacci(n):\n    # Complete this function to calculate fibonacci numbers",
-        'chat_prompt': "User: What is the capital of France?\nAssistant: The capital of France is Paris.\nUser: What about Germany?",
-    }
+    """Test data for performance benchmarking (read-only mapping)."""
+    return _PERF_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def benchmark_configs():
-    """Different configurations for benchmarking."""
+    """Different configurations for benchmarking. Shared across the session; do not mutate."""
     return {
         'fast': GenerationConfig(max_tokens=50, temperature=0.1),
         'balanced': GenerationConfig(max_tokens=256, temperature=0.7),
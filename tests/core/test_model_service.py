@@ -3,62 +3,83 @@ Unit tests for the ModelService component.
 """
 
 import unittest
-import tempfile
-import shutil
 import os
+import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
-from PySide6.QtCore import QCoreApplication
-
 from app.core.model_service import ModelService, ModelLoadingThread
 from app.core.event_bus import EventBus
-from app.models.gguf_model import GGUFModel
+
+
+# GGUF magic bytes followed by some dummy data
+_GGUF_STUB_SMALL = b"GGUF" + bytes(1024)
+
+
+def _create_mock_gguf_file(path):
+    """Create a mock GGUF file for testing."""
+    Path(path).write_bytes(_GGUF_STUB_SMALL)
+
+
+class _FakeGGUFModel:
+    """Plain stand-in for a loaded GGUFModel that records access/unload calls."""
+    
+    def __init__(self, file_path):
+        self.name = "test_model"
+        self.file_path = file_path
+        self.size = 1024
+        self.parameters = {"context_length": 2048}
+        self.metadata = {"architecture": "test"}
+        self.memory_usage = 512
+        self.load_time = None
+        self.last_accessed = None
+        self.loaded = True
+        self.load_type = "mmap"
+        self.hardware_backend = None
+        self.hardware_device = None
+        self.access_calls = 0
+        self.unload_calls = 0
+    
+    def get_size_str(self):
+        return "1.00 KB"
+    
+    def access(self):
+        self.access_calls += 1
+    
+    def unload(self):
+        self.unload_calls += 1
+    
+    def _llama_model(self, prompt, **kwargs):
+        return {'choices': [{'text': 'Generated text response'}]}
+
+
+@pytest.fixture(scope="module")
+def mock_gguf_path(tmp_path_factory):
+    """Create a mock GGUF file shared by the tests in this module."""
+    path = tmp_path_factory.mktemp("models") / "test_model.gguf"
+    _create_mock_gguf_file(path)
+    return path
+
 
 class TestModelService(unittest.TestCase):
     """Test cases for the ModelService class."""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up test fixtures for the class."""
-        # Create QApplication if it doesn't exist
-        if not QCoreApplication.instance():
-            cls.app = QCoreApplication([])
-        else:
-            cls.app = QCoreApplication.instance()
+    @pytest.fixture(autouse=True)
+    def _use_shared_fixtures(self, mock_gguf_path, shared_event_bus):
+        """Expose the shared mock GGUF file and a freshly reset event bus."""
+        self.test_model_path = mock_gguf_path
+        shared_event_bus.reset()
+        self.event_bus = shared_event_bus
     
     def setUp(self):
         """Set up test fixtures."""
-        # Create event bus
-        self.event_bus = EventBus()
-        
         # Create model service
         self.model_service = ModelService(self.event_bus)
-        
-        # Create temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_model_path = Path(self.temp_dir) / "test_model.gguf"
-        
-        # Create a mock GGUF file
-        self._create_mock_gguf_file()
     
     def tearDown(self):
         """Tear down test fixtures."""
         # Clean up model service
         self.model_service.unload_all_models()
-        
-        # Shut down event bus
-        self.event_bus.shutdown()
-        
-        # Remove temporary directory
-        shutil.rmtree(self.temp_dir)
-    
-    def _create_mock_gguf_file(self):
-        """Create a mock GGUF file for testing."""
-        # Create a file with GGUF magic bytes
-        with open(self.test_model_path, 'wb') as f:
-            f.write(b"GGUF")  # Magic bytes
-            f.write(b"\x00" * 1024)  # Some dummy data
     
     def test_initialization(self):
         """Test ModelService initialization."""
@@ -125,18 +146,8 @@ class TestModelService(unittest.TestCase):
         mock_extract.return_value = True
         mock_load.return_value = True
         
-        # Create a flag to track if model was loaded
-        model_loaded = False
-        
-        def on_model_loaded(model_id, model_info):
-            nonlocal model_loaded
-            model_loaded = True
-            self.assertIsInstance(model_id, str)
-            self.assertIsInstance(model_info, dict)
-            self.assertIn("name", model_info)
-            self.assertIn("file_path", model_info)
-        
-        # Connect to the signal
+        # Connect a mock slot to track if model was loaded
+        on_model_loaded = Mock()
         self.model_service.model_loaded.connect(on_model_loaded)
         
         # Create and run the loading thread
@@ -146,6 +157,12 @@ class TestModelService(unittest.TestCase):
         # Process the result
         if hasattr(loading_thread, '_result_model'):
             self.model_service._on_model_loaded(loading_thread._result_model)
+            on_model_loaded.assert_called_once()
+            model_id, model_info = on_model_loaded.call_args.args
+            self.assertIsInstance(model_id, str)
+            self.assertIsInstance(model_info, dict)
+            self.assertIn("name", model_info)
+            self.assertIn("file_path", model_info)
         
         # Note: In a real test, we would need to properly mock the GGUFModel
         # and handle the asynchronous loading. This is a simplified test.
@@ -156,16 +173,8 @@ class TestModelService(unittest.TestCase):
         # Mock validation failure
         mock_validate.return_value = (False, "Invalid GGUF file")
         
-        # Create a flag to track if error was emitted
-        error_emitted = False
-        error_message = None
-        
-        def on_loading_error(message):
-            nonlocal error_emitted, error_message
-            error_emitted = True
-            error_message = message
-        
-        # Connect to the signal
+        # Connect a mock slot to track if error was emitted
+        on_loading_error = Mock()
         self.model_service.loading_error.connect(on_loading_error)
         
         # Create and run the loading thread
@@ -176,22 +185,15 @@ class TestModelService(unittest.TestCase):
     
     def test_handle_load_request_no_file_path(self):
         """Test handling load request without file path."""
-        # Create a flag to track if error was emitted
-        error_emitted = False
-        
-        def on_loading_error(message):
-            nonlocal error_emitted
-            error_emitted = True
-            self.assertEqual(message, "No file path provided")
-        
-        # Connect to the signal
+        # Connect a mock slot to track if error was emitted
+        on_loading_error = Mock()
         self.model_service.loading_error.connect(on_loading_error)
         
         # Send load request without file path
         self.model_service._handle_load_request({})
         
         # Check that error was emitted
-        self.assertTrue(error_emitted)
+        on_loading_error.assert_called_once_with("No file path provided")
     
     def test_handle_unload_request_nonexistent(self):
         """Test handling unload request for nonexistent model."""
@@ -204,38 +206,17 @@ class TestModelService(unittest.TestCase):
     def test_event_bus_integration(self):
         """Test integration with event bus."""
         # Test that the service subscribes to the correct events
-        load_subscribers = self.event_bus.get_subscriber_count("model.load.request")
-        unload_subscribers = self.event_bus.get_subscriber_count("model.unload.request")
+        snapshot = self.event_bus.snapshot_subscriber_counts()
         
         # The service should be subscribed to these events
-        self.assertGreaterEqual(load_subscribers, 1)
-        self.assertGreaterEqual(unload_subscribers, 1)
+        self.assertGreaterEqual(snapshot.get("model.load.request", 0), 1)
+        self.assertGreaterEqual(snapshot.get("model.unload.request", 0), 1)
+        self.assertGreaterEqual(snapshot.get("model.load.cancel", 0), 1)
     
     def test_mock_model_operations(self):
         """Test model operations with a mock model."""
-        # Create a mock model
-        mock_model = Mock(spec=GGUFModel)
-        mock_model.name = "test_model"
-        mock_model.file_path = str(self.test_model_path)
-        mock_model.size = 1024
-        mock_model.get_size_str.return_value = "1.00 KB"
-        mock_model.parameters = {"context_length": 2048}
-        mock_model.metadata = {"architecture": "test"}
-        mock_model.memory_usage = 512
-        mock_model.load_time = None
-        mock_model.last_accessed = None
-        mock_model.loaded = True
-        mock_model.load_type = "mmap"
-        mock_model.hardware_backend = None
-        mock_model.hardware_device = None
-        mock_model.access = Mock()
-        
-        # Add mock llama model for text generation
-        mock_llama_model = Mock()
-        mock_llama_model.return_value = {
-            'choices': [{'text': 'Generated text response'}]
-        }
-        mock_model._llama_model = mock_llama_model
+        # Create a fake model
+        mock_model = _FakeGGUFModel(str(self.test_model_path))
         
         # Manually add the model to the service
         model_id = "test_model_1"
@@ -270,50 +251,24 @@ class TestModelService(unittest.TestCase):
         # Test generate_text
         result = self.model_service.generate_text("Hello, world!")
         self.assertEqual(result, "Generated text response")
-        mock_model.access.assert_called_once()
+        self.assertEqual(mock_model.access_calls, 1)
         
         # Test set_current_model
         self.assertTrue(self.model_service.set_current_model(model_id))
         
         # Test unload
-        mock_model.unload = Mock()
         self.model_service._handle_unload_request(model_id)
-        mock_model.unload.assert_called_once()
+        self.assertEqual(mock_model.unload_calls, 1)
         self.assertNotIn(model_id, self.model_service.loaded_models)
         self.assertIsNone(self.model_service.current_model_id)
 
 class TestModelLoadingThread(unittest.TestCase):
     """Test cases for the ModelLoadingThread class."""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up test fixtures for the class."""
-        # Create QApplication if it doesn't exist
-        if not QCoreApplication.instance():
-            cls.app = QCoreApplication([])
-        else:
-            cls.app = QCoreApplication.instance()
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_model_path = Path(self.temp_dir) / "test_model.gguf"
-        
-        # Create a mock GGUF file
-        self._create_mock_gguf_file()
-    
-    def tearDown(self):
-        """Tear down test fixtures."""
-        # Remove temporary directory
-        shutil.rmtree(self.temp_dir)
-    
-    def _create_mock_gguf_file(self):
-        """Create a mock GGUF file for testing."""
-        # Create a file with GGUF magic bytes
-        with open(self.test_model_path, 'wb') as f:
-            f.write(b"GGUF")  # Magic bytes
-            f.write(b"\x00" * 1024)  # Some dummy data
+    @pytest.fixture(autouse=True)
+    def _use_mock_gguf_path(self, mock_gguf_path):
+        """Expose the shared mock GGUF file to the test methods."""
+        self.test_model_path = mock_gguf_path
     
     def test_initialization(self):
         """Test ModelLoadingThread initialization."""
@@ -328,25 +283,19 @@ class TestModelLoadingThread(unittest.TestCase):
     
     def test_nonexistent_file(self):
         """Test loading thread with nonexistent file."""
-        nonexistent_path = str(Path(self.temp_dir) / "nonexistent.gguf")
+        nonexistent_path = str(self.test_model_path.parent / "nonexistent.gguf")
         thread = ModelLoadingThread(nonexistent_path)
         
         # Track signals
-        error_emitted = False
-        error_message = None
-        
-        def on_error(message):
-            nonlocal error_emitted, error_message
-            error_emitted = True
-            error_message = message
-        
+        on_error = Mock()
         thread.error.connect(on_error)
         
         # Run the thread
         thread.run()
         
         # Check that error was emitted
-        self.assertTrue(error_emitted)
+        on_error.assert_called_once()
+        error_message, = on_error.call_args.args
         self.assertIn("does not exist", error_message)
 
 if __name__ == "__main__":
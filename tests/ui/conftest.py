@@ -4,22 +4,19 @@ Pytest fixtures for UI testing.
 
 import os
 import sys
+import copy
+import logging
+import importlib
 import pytest
+from functools import lru_cache
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from PySide6.QtWidgets import QApplication, QMainWindow
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QDir, QThreadPool
 
 # Import application components
-from app.ui.main_window import MainWindow
-from app.ui.model_info_view import ModelInfoView
-from app.ui.file_dialog import GGUFFileDialog
-from app.ui.preferences_dialog import PreferencesDialog
-from app.ui.error_dialog import ErrorDetailsDialog
-from app.ui.addon_management_view import AddonManagementView
-from app.ui.addon_installation_dialog import AddonInstallationDialog
-from app.ui.addon_configuration_dialog import AddonConfigurationDialog
+from app.core.config_manager import ConfigManager
 
 # Import test utilities
 from tests.utils.mock_objects import (
@@ -28,136 +25,368 @@ from tests.utils.mock_objects import (
     MockGGUFModel,
     MockAppConfig
 )
+from tests.utils.test_helpers import create_mock_gguf_file
 
-@pytest.fixture
-def main_window(qapp, mock_event_bus, mock_config_manager):
-    """Create a MainWindow instance for testing."""
-    # Create mock components
-    model_manager = MockModelManager.create_mock()
-    addon_manager = MockAddonManager.create_mock()
+logger = logging.getLogger("tests.ui")
+
+# UI classes under test and their modules. They are imported on first use
+# so collection does not pay for the widget modules.
+_UI_CLASSES = {
+    "MainWindow": "app.ui.main_window",
+    "ModelInfoView": "app.ui.model_info_view",
+    "GGUFFileDialog": "app.ui.file_dialog",
+    "PreferencesDialog": "app.ui.preferences_dialog",
+    "ErrorDetailsDialog": "app.ui.error_dialog",
+    "AddonManagementView": "app.ui.addon_management_view",
+    "AddonInstallationDialog": "app.ui.addon_installation_dialog",
+    "AddonConfigurationDialog": "app.ui.addon_configuration_dialog",
+}
+
+@lru_cache(maxsize=None)
+def _get_class(name):
+    """Import and return a UI class by name."""
+    return getattr(importlib.import_module(_UI_CLASSES[name]), name)
+
+@pytest.fixture(scope="session", autouse=True)
+def _minimal_ui_style(qapp):
+    """
+    Use a plain widget style for the UI tests.
+    
+    Fusion avoids the platform style's extra polish work. ThemeManager's
+    application-wide palette and stylesheet are skipped, because every widget
+    re-polishes against them and no test checks the theme.
+    """
+    qapp.setStyle("Fusion")
+    qapp.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    qapp.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+    
+    with patch("app.ui.theme_manager.ThemeManager._apply_theme"):
+        yield
+
+@pytest.fixture(scope="module", autouse=True)
+def _drain_events_at_module_teardown(qapp):
+    """
+    Process pending events once after all module-scoped widgets are closed,
+    and wait for any screenshots still being written.
+    """
+    yield
+    qapp.processEvents()
+    QThreadPool.globalInstance().waitForDone()
+
+# Widget fixtures are module-scoped: each widget is built once per test
+# module and _reset_main_window restores the shared state between tests.
+# The mocks they depend on must therefore be module-scoped too.
+
+# Each mock template is built once per session and deep-copied wherever a
+# fresh mock is needed; deep copies have their own call records and state.
+
+@pytest.fixture(scope="session")
+def _mock_model_manager_template():
+    """Build the default mock model manager once per session."""
+    return MockModelManager.create_mock()
+
+@pytest.fixture(scope="session")
+def _mock_addon_manager_template():
+    """Build the default mock addon manager once per session."""
+    return MockAddonManager.create_mock()
+
+@pytest.fixture(scope="session")
+def _mock_gguf_model_template():
+    """Build the default mock GGUF model once per session."""
+    return MockGGUFModel.create_mock("test-model", "Test Model")
+
+@pytest.fixture(scope="module")
+def shared_mock_gguf(tmp_path_factory):
+    """
+    Create a mock GGUF file once per module.
+    
+    Shared by every test in the module; tests that modify the file should
+    create their own in ``temp_dir`` instead.
+    """
+    return create_mock_gguf_file(tmp_path_factory.mktemp("gguf"), "test_model.gguf")
+
+class _EventBusSpy:
+    """
+    Minimal stand-in for EventBus used by the UI tests.
+    
+    Records every published event in ``calls`` as ``(event_name, args)``
+    and dispatches it synchronously to the subscribed callbacks. The
+    callbacks for each event are kept as a precomputed tuple, rebuilt on
+    (un)subscribe, so publishing is a dict lookup and a loop.
+    """
+    
+    def __init__(self):
+        self.calls = []
+        self._subscribers = {}
+        self._handlers = {}
+    
+    def subscribe(self, event_name, callback, subscriber_id=None, **kwargs):
+        """Subscribe a callback to an event; returns the subscriber ID."""
+        subscribers = self._subscribers.setdefault(event_name, {})
+        subscriber_id = subscriber_id or f"{event_name}:{id(callback)}"
+        subscribers[subscriber_id] = callback
+        self._handlers[event_name] = tuple(subscribers.values())
+        return subscriber_id
+    
+    def unsubscribe(self, event_name, subscriber_id):
+        """Remove a subscription; returns True if it existed."""
+        subscribers = self._subscribers.get(event_name, {})
+        if subscribers.pop(subscriber_id, None) is None:
+            return False
+        self._handlers[event_name] = tuple(subscribers.values())
+        return True
+    
+    def publish(self, event_name, *args, **kwargs):
+        """Record the event and call its subscribers."""
+        self.calls.append((event_name, args))
+        for callback in self._handlers.get(event_name, ()):
+            callback(*args, **kwargs)
     
+    # The real bus hands async publishes to a worker thread; the spy runs them
+    # inline so assertions never have to wait for the event loop.
+    publish_async = publish
+    
+    def assert_any_call(self, event_name, *args):
+        """Assert that the event was published with these arguments."""
+        assert (event_name, args) in self.calls, (
+            f"{event_name}{args} was not published; published: {self.calls}"
+        )
+
+@pytest.fixture(scope="module")
+def mock_event_bus():
+    """Create an event bus spy shared by the widgets of a test module."""
+    return _EventBusSpy()
+
+@pytest.fixture(scope="module")
+def mock_config_manager():
+    """Create a mock config manager shared by the widgets of a test module."""
+    return MagicMock(spec=ConfigManager)
+
+@pytest.fixture(scope="module")
+def mock_addon_manager(_mock_addon_manager_template):
+    """Create a mock addon manager shared by the widgets of a test module."""
+    return copy.deepcopy(_mock_addon_manager_template)
+
+@pytest.fixture(scope="module")
+def mock_model_manager(_mock_model_manager_template):
+    """Create a mock model manager shared by the widgets of a test module."""
+    return copy.deepcopy(_mock_model_manager_template)
+
+@pytest.fixture(scope="module")
+def mock_backend_manager():
+    """
+    Create a mock backend manager shared by the widgets of a test module.
+    
+    Without it MainWindow builds (and on close cleans up) a real
+    PerformanceIntegratedBackendManager.
+    """
+    return MagicMock()
+
+# Mocks injected into the shared MainWindow; _reset_main_window resets them
+_MAIN_WINDOW_MOCKS = ("mock_config_manager", "mock_backend_manager")
+
+def _managed_widget(widget, show=False):
+    """
+    Yield a widget for a fixture and close it on teardown.
+    
+    Shown widgets are marked WA_DontShowOnScreen so they are never mapped
+    on the display. Pending events are not processed here; they are drained
+    once at module teardown.
+    """
+    if show:
+        widget.setAttribute(Qt.WA_DontShowOnScreen, True)
+        widget.show()
+    
+    yield widget
+    
+    widget.close()
+
+@pytest.fixture(scope="module")
+def main_window(qapp, mock_event_bus, mock_config_manager, mock_backend_manager):
+    """
+    Create a MainWindow instance shared by the tests of a module.
+    
+    Tests that change the window irreversibly (e.g. close it) should use
+    ``closable_main_window`` instead.
+    """
     # Create the main window
-    window = MainWindow(
+    window = _get_class("MainWindow")(
         event_bus=mock_event_bus,
         config_manager=mock_config_manager,
-        model_manager=model_manager,
-        addon_manager=addon_manager
+        backend_manager=mock_backend_manager
     )
     
-    # Show the window (but don't actually display it)
-    window.show()
-    QApplication.processEvents()
+    yield from _managed_widget(window, show=True)
+
+@pytest.fixture
+def closable_main_window(qapp):
+    """Create a MainWindow with its own mocks, for a single test."""
+    config_manager = MagicMock(spec=ConfigManager)
+    # MainWindow._save_window_state writes through config_manager.set
+    config_manager.set = MagicMock()
     
-    yield window
+    window = _get_class("MainWindow")(
+        event_bus=_EventBusSpy(),
+        config_manager=config_manager,
+        backend_manager=MagicMock()
+    )
     
-    # Clean up
-    window.close()
-    QApplication.processEvents()
+    yield from _managed_widget(window, show=True)
 
-@pytest.fixture
-def model_info_view(qapp, mock_event_bus):
+_MAIN_WINDOW_MENUS = ("file", "view", "tools", "addons", "help")
+
+class _ActionIndex:
+    """The main window's menu actions, listed once per menu."""
+    
+    def __init__(self, window):
+        self._menus = {
+            name: tuple(getattr(window, f"{name}_menu").actions())
+            for name in _MAIN_WINDOW_MENUS
+        }
+    
+    def actions(self, menu):
+        """Return all actions of a menu, in menu order."""
+        return self._menus[menu]
+    
+    def find(self, menu, text):
+        """Return the first action in a menu whose text (without mnemonics) contains ``text``."""
+        for action in self._menus[menu]:
+            if text in action.text().replace("&", ""):
+                return action
+        raise LookupError(f"No action containing {text!r} in the {menu} menu")
+
+@pytest.fixture(scope="module")
+def main_window_action_index(main_window):
+    """
+    Index the main window's menu actions by menu.
+    
+    Look actions up by substring, as ``index.find("tools", "Preferences")``,
+    or list a menu with ``index.actions("file")``.
+    """
+    return _ActionIndex(main_window)
+
+@pytest.fixture(scope="module")
+def model_info_view(qapp, mock_event_bus, _mock_gguf_model_template):
     """Create a ModelInfoView instance for testing."""
     # Create mock model
-    model = MockGGUFModel.create_mock("test-model", "Test Model")
+    model = copy.deepcopy(_mock_gguf_model_template)
     
     # Create the view
-    view = ModelInfoView(mock_event_bus)
+    view = _get_class("ModelInfoView")(mock_event_bus)
     
     # Set the model
     view.set_model(model)
     
-    # Show the view
-    view.show()
-    QApplication.processEvents()
-    
-    yield view
-    
-    # Clean up
-    view.close()
-    QApplication.processEvents()
+    yield from _managed_widget(view, show=True)
 
-@pytest.fixture
-def file_dialog(qapp, mock_config_manager):
-    """Create a GGUFFileDialog instance for testing."""
-    # Create the dialog
-    dialog = GGUFFileDialog()
+@pytest.fixture(scope="module")
+def file_dialog(qapp):
+    """
+    Create a GGUFFileDialog instance for testing.
     
-    yield dialog
+    The dialog (and its file listing) is built once per module;
+    _reset_file_dialog restores its selection and directory between tests.
+    """
+    # Create the dialog
+    dialog = _get_class("GGUFFileDialog")()
     
-    # Clean up
-    dialog.close()
-    QApplication.processEvents()
+    yield from _managed_widget(dialog)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def preferences_dialog(qapp, mock_config_manager, mock_event_bus):
     """Create a PreferencesDialog instance for testing."""
     # Create the dialog
-    dialog = PreferencesDialog(mock_config_manager, mock_event_bus)
+    dialog = _get_class("PreferencesDialog")(mock_config_manager, mock_event_bus)
     
-    yield dialog
-    
-    # Clean up
-    dialog.close()
-    QApplication.processEvents()
+    yield from _managed_widget(dialog)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def error_dialog(qapp):
     """Create an ErrorDetailsDialog instance for testing."""
     # Create the dialog
     test_error = Exception("This is a test error message.")
-    dialog = ErrorDetailsDialog(test_error, "test", "Test Error")
-    
-    yield dialog
+    dialog = _get_class("ErrorDetailsDialog")(test_error, "test", "Test Error")
     
-    # Clean up
-    dialog.close()
-    QApplication.processEvents()
+    yield from _managed_widget(dialog)
 
-@pytest.fixture
-def addon_management_view(qapp, mock_addon_manager):
-    """Create an AddonManagementView instance for testing."""
-    # Create the view
-    view = AddonManagementView(mock_addon_manager)
-    
-    # Show the view
-    view.show()
-    QApplication.processEvents()
+# Construction table for the addon widgets:
+# class name -> (constructor args from (addon_manager, event_bus), shown on screen)
+_ADDON_WIDGETS = {
+    "AddonManagementView": (lambda addon_manager, event_bus: (addon_manager,), True),
+    "AddonInstallationDialog": (lambda addon_manager, event_bus: (addon_manager, event_bus), False),
+    "AddonConfigurationDialog": (lambda addon_manager, event_bus: (addon_manager, "addon1", event_bus), False),
+}
+
+@pytest.fixture(scope="module", params=list(_ADDON_WIDGETS))
+def addon_widget(request, qapp, mock_addon_manager, mock_event_bus):
+    """
+    Create each addon widget (management view, installation and
+    configuration dialogs) in turn; tests using it run once per widget.
+    """
+    class_name = request.param
+    build_args, show = _ADDON_WIDGETS[class_name]
     
-    yield view
+    # Create the widget
+    widget = _get_class(class_name)(*build_args(mock_addon_manager, mock_event_bus))
     
-    # Clean up
-    view.close()
-    QApplication.processEvents()
+    yield from _managed_widget(widget, show=show)
 
-@pytest.fixture
-def addon_installation_dialog(qapp, mock_addon_manager, mock_event_bus):
-    """Create an AddonInstallationDialog instance for testing."""
-    # Create the dialog
-    dialog = AddonInstallationDialog(mock_addon_manager, mock_event_bus)
+@pytest.fixture(autouse=True)
+def _reset_main_window(request):
+    """
+    Reset the shared MainWindow and its mocks before each test that uses it.
     
-    yield dialog
+    Tests that don't request main_window are left alone, so the window is
+    never built just for this fixture. Pending events (show, polish, layout)
+    of the module-scoped widgets are drained here once per test.
+    """
+    if "main_window" not in request.fixturenames:
+        QApplication.processEvents()
+        yield
+        return
     
-    # Clean up
-    dialog.close()
-    QApplication.processEvents()
-
-@pytest.fixture
-def addon_configuration_dialog(qapp, mock_addon_manager, mock_event_bus):
-    """Create an AddonConfigurationDialog instance for testing."""
-    # Create the dialog
-    dialog = AddonConfigurationDialog(mock_addon_manager, "addon1", mock_event_bus)
+    main_window = request.getfixturevalue("main_window")
+    mock_event_bus = request.getfixturevalue("mock_event_bus")
     
-    yield dialog
+    model_info_visible = main_window.model_info_view.isVisible()
+    main_window.status_bar.showMessage("Ready")
+    mock_event_bus.calls.clear()
     
-    # Clean up
-    dialog.close()
+    # Clear call history; configured return values and side effects stay
+    for name in _MAIN_WINDOW_MOCKS:
+        request.getfixturevalue(name).reset_mock()
     QApplication.processEvents()
+    
+    yield
+    
+    # Restore anything a test may have toggled
+    main_window.model_info_view.setVisible(model_info_visible)
+
+@pytest.fixture(autouse=True)
+def _reset_file_dialog(request):
+    """Clear the shared file dialog's selection before each test that uses it."""
+    if "file_dialog" in request.fixturenames:
+        dialog = request.getfixturevalue("file_dialog")
+        dialog.file_name_edit.clear()
+        dialog.selected_file = ""
+        
+        # Only re-list files if a test navigated away from the default directory
+        if dialog.current_directory != QDir.homePath():
+            dialog.current_directory = QDir.homePath()
+            dialog._populate_file_list()
+    yield
+
+# Failure screenshots are opt-in (UI_SCREENSHOTS=1); otherwise the report
+# hook below is not registered and screenshot_on_failure does nothing.
+_SCREENSHOTS_ENABLED = os.environ.get("UI_SCREENSHOTS") == "1"
 
 @pytest.fixture
 def screenshot_on_failure(request, qapp):
     """
     Take a screenshot when a test fails.
     
+    Only active when the UI_SCREENSHOTS environment variable is set to 1.
+    
     Usage:
         @pytest.mark.usefixtures("screenshot_on_failure")
         def test_something(qapp):
@@ -165,37 +394,57 @@ def screenshot_on_failure(request, qapp):
     """
     yield
     
+    if not _SCREENSHOTS_ENABLED:
+        return
+    
     # Check if the test failed
     if request.node.rep_call.failed:
         # Get the test name
         test_name = request.node.name
         
-        # Create screenshots directory if it doesn't exist
-        screenshots_dir = Path("screenshots")
-        screenshots_dir.mkdir(exist_ok=True)
-        
-        # Take a screenshot of all top-level windows
+        # First pass: capture all visible top-level windows
+        captures = []
+        screen = QApplication.primaryScreen()
         for i, window in enumerate(QApplication.topLevelWidgets()):
             if isinstance(window, QMainWindow) and window.isVisible():
                 # Create a unique filename
                 filename = f"screenshots/{test_name}_{i}.png"
                 
-                # Take the screenshot
-                pixmap = window.grab()
-                pixmap.save(filename)
+                # Take the screenshot: windows kept off screen have nothing to
+                # capture natively, so render those instead
+                if window.testAttribute(Qt.WA_DontShowOnScreen) or screen is None:
+                    pixmap = window.grab()
+                else:
+                    pixmap = screen.grabWindow(window.winId())
                 
-                print(f"Screenshot saved to {filename}")
+                # QImage (unlike QPixmap) can be saved outside the GUI thread
+                captures.append((filename, pixmap.toImage()))
+        
+        if not captures:
+            return
+        
+        # Second pass: write everything to disk in the background
+        Path("screenshots").mkdir(exist_ok=True)
+        for filename, image in captures:
+            _save_image_async(image, filename)
+        
+        logger.info("Screenshots saved to %s", ", ".join(filename for filename, _ in captures))
 
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """
-    Store the test result for the screenshot_on_failure fixture.
-    """
-    # Execute the hook
-    outcome = yield
-    
-    # Get the result
-    rep = outcome.get_result()
-    
-    # Set the result attribute on the test node
-    setattr(item, f"rep_{rep.when}", rep)
\ No newline at end of file
+def _save_image_async(image, filename):
+    """Write an image to disk on the global thread pool."""
+    QThreadPool.globalInstance().start(lambda: image.save(filename))
+
+if _SCREENSHOTS_ENABLED:
+    @pytest.hookimpl(tryfirst=True, hookwrapper=True)
+    def pytest_runtest_makereport(item, call):
+        """
+        Store the test result for the screenshot_on_failure fixture.
+        """
+        # Execute the hook
+        outcome = yield
+        
+        # Get the result
+        rep = outcome.get_result()
+        
+        # Set the result attribute on the test node
+        setattr(item, f"rep_{rep.when}", rep)
@@ -9,6 +9,7 @@ Tests the BackendManager class including:
 - Performance monitoring integration
 """
 
+import copy
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import time
@@ -16,10 +17,11 @@ from pathlib import Path
 
 from core.backend_manager import BackendManager, BackendStatus
 from core.model_backends import (
-    BackendConfig, BackendType, HardwareInfo, LoadingResult, 
+    BackendConfig, BackendType, HardwareInfo, HardwarePreference, LoadingResult, 
     GenerationConfig, ModelLoadingError
 )
 from core.hardware_detector import HardwareDetector
+from core.performance_integration import PerformanceIntegratedBackendManager
 
 
 class TestBackendStatus:
@@ -61,97 +63,140 @@ class TestBackendStatus:
         assert status.average_load_time == 0.0
 
 
+@pytest.fixture(scope="module")
+def backend_status_template():
+    """Mock backend status shared by the module; copied per test by `manager`."""
+    now = time.time()
+    return {
+        "ctransformers": BackendStatus(
+            name="ctransformers",
+            available=True,
+            error_message=None,
+            last_checked=now
+        ),
+        "transformers": BackendStatus(
+            name="transformers",
+            available=True,
+            error_message=None,
+            last_checked=now
+        ),
+        "llamafile": BackendStatus(
+            name="llamafile",
+            available=False,
+            error_message="Not installed",
+            last_checked=now
+        )
+    }
+
+
+@pytest.fixture
+def hardware_detector():
+    """Create a mocked hardware detector (fresh per test for call assertions)."""
+    detector = Mock(spec=HardwareDetector)
+    detector.get_hardware_info.return_value = HardwareInfo(
+        gpu_count=1,
+        total_vram=8192,
+        cpu_cores=8,
+        total_ram=16384,
+        recommended_backend="ctransformers"
+    )
+    detector.get_optimal_settings.return_value = {
+        'gpu_enabled': True,
+        'gpu_layers': -1,
+        'context_size': 4096,
+        'batch_size': 512,
+        'threads': 8
+    }
+    return detector
+
+
+@pytest.fixture
+def manager(hardware_detector, backend_status_template):
+    """Create a backend manager with mocked hardware detector and status."""
+    with patch('core.backend_manager.monitoring_manager'):
+        manager = BackendManager(hardware_detector)
+
+    # Backend probing is deferred to first use; mark it done so the
+    # mock statuses below are used as-is
+    manager._ready = True
+    manager.backend_status = {
+        name: copy.copy(status) for name, status in backend_status_template.items()
+    }
+    return manager
+
+
 class TestBackendManager:
     """Test BackendManager functionality."""
-    
-    def setup_method(self):
-        """Set up test backend manager."""
-        # Mock hardware detector
-        self.mock_hardware_detector = Mock(spec=HardwareDetector)
-        self.mock_hardware_detector.get_hardware_info.return_value = HardwareInfo(
-            gpu_count=1,
-            total_vram=8192,
-            cpu_cores=8,
-            total_ram=16384,
-            recommended_backend="ctransformers"
-        )
-        self.mock_hardware_detector.get_optimal_settings.return_value = {
-            'gpu_enabled': True,
-            'gpu_layers': -1,
-            'context_size': 4096,
-            'batch_size': 512,
-            'threads': 8
-        }
-        
-        # Create backend manager with mocked hardware detector
+
+    def test_initialization(self, manager, hardware_detector):
+        """Test backend manager initialization."""
+        assert manager.hardware_detector == hardware_detector
+        assert isinstance(manager.backends, dict)
+        assert isinstance(manager.backend_status, dict)
+        assert isinstance(manager.configs, dict)
+        assert manager.current_backend is None
+        assert manager.current_model_path is None
+        assert isinstance(manager.fallback_order, list)
+    
+    def test_backend_probing_deferred(self, hardware_detector):
+        """Test that backends are only probed on first use."""
         with patch('core.backend_manager.monitoring_manager'), \
-             patch.object(BackendManager, '_ensure_backends_registered'), \
-             patch.object(BackendManager, '_detect_available_backends'):
+             patch.object(BackendManager, '_ensure_backends_registered') as mock_register, \
+             patch.object(BackendManager, '_detect_available_backends') as mock_detect:
             
-            self.manager = BackendManager(self.mock_hardware_detector)
+            manager = BackendManager(hardware_detector)
+            mock_register.assert_not_called()
+            mock_detect.assert_not_called()
             
-            # Set up mock backend status
-            self.manager.backend_status = {
-                "ctransformers": BackendStatus(
-                    name="ctransformers",
-                    available=True,
-                    error_message=None,
-                    last_checked=time.time()
-                ),
-                "transformers": BackendStatus(
-                    name="transformers", 
-                    available=True,
-                    error_message=None,
-                    last_checked=time.time()
-                ),
-                "llamafile": BackendStatus(
-                    name="llamafile",
-                    available=False,
-                    error_message="Not installed",
-                    last_checked=time.time()
-                )
-            }
+            # Reporting paths do not trigger probing
+            manager.get_statistics()
+            mock_detect.assert_not_called()
+            
+            manager.get_available_backends()
+            manager.get_best_backend()
+            mock_register.assert_called_once()
+            mock_detect.assert_called_once()
     
-    def test_initialization(self):
-        """Test backend manager initialization."""
-        assert self.manager.hardware_detector == self.mock_hardware_detector
-        assert isinstance(self.manager.backends, dict)
-        assert isinstance(self.manager.backend_status, dict)
-        assert isinstance(self.manager.configs, dict)
-        assert self.manager.current_backend is None
-        assert self.manager.current_model_path is None
-        assert isinstance(self.manager.fallback_order, list)
-    
-    def test_get_available_backends(self):
+    def test_get_available_backends(self, manager):
         """Test getting available backends."""
-        available = self.manager.get_available_backends()
+        available = manager.get_available_backends()
         
         assert "ctransformers" in available
         assert "transformers" in available
         assert "llamafile" not in available  # Marked as unavailable
     
-    def test_get_backend_status(self):
+    def test_available_backends_follow_status_changes(self, manager):
+        """Test that available backends reflect in-place status updates."""
+        assert manager.get_available_backends() == ["ctransformers", "transformers"]
+        
+        manager.backend_status["llamafile"].available = True
+        assert "llamafile" in manager.get_available_backends()
+        
+        manager.backend_status = {}
+        assert manager.get_available_backends() == []
+    
+    def test_get_backend_status(self, manager):
         """Test getting backend status."""
-        status = self.manager.get_backend_status("ctransformers")
+        status = manager.get_backend_status("ctransformers")
         
         assert isinstance(status, BackendStatus)
         assert status.name == "ctransformers"
         assert status.available is True
         
         # Test non-existent backend
-        status = self.manager.get_backend_status("nonexistent")
+        status = manager.get_backend_status("nonexistent")
         assert status is None
     
-    def test_get_best_backend_auto(self):
+    def test_get_best_backend_auto(self, manager):
         """Test automatic best backend selection."""
-        best = self.manager.get_best_backend(model_size_mb=4096)
+        best = manager.get_best_backend(model_size_mb=4096)
         
         # Should return the recommended backend from hardware detector
         assert best == "ctransformers"
     
-    def test_get_best_backend_gpu_preference(self):
+    def test_get_best_backend_gpu_preference(self, manager):
         """Test best backend selection with GPU preference."""
-        best = self.manager.get_best_backend(
+        best = manager.get_best_backend(
             model_size_mb=4096, 
             hardware_preference='gpu'
         )
@@ -159,9 +204,9 @@ class TestBackendManager:
         # Should prefer GPU-capable backends
         assert best in ["ctransformers", "transformers"]
     
-    def test_get_best_backend_cpu_preference(self):
+    def test_get_best_backend_cpu_preference(self, manager):
         """Test best backend selection with CPU preference."""
-        best = self.manager.get_best_backend(
+        best = manager.get_best_backend(
             model_size_mb=4096,
             hardware_preference='cpu'
         )
@@ -169,32 +214,81 @@ class TestBackendManager:
         # Should prefer CPU-friendly backends
         assert best in ["ctransformers"]  # llamafile not available in test
     
-    def test_get_best_backend_no_available(self):
+    def test_get_best_backend_gpu_preference_no_gpu(self, manager, hardware_detector, caplog):
+        """Test that a GPU preference without GPUs falls back and warns on every call."""
+        hardware_detector.get_hardware_info.return_value = HardwareInfo(
+            gpu_count=0,
+            total_vram=0,
+            cpu_cores=8,
+            total_ram=16384,
+            recommended_backend="ctransformers"
+        )
+        
+        with caplog.at_level("WARNING", logger="backend.manager"):
+            for _ in range(2):
+                assert manager.get_best_backend(hardware_preference='gpu') == "ctransformers"
+        
+        warnings = [r for r in caplog.records if "no GPUs detected" in r.getMessage()]
+        assert len(warnings) == 2
+    
+    def test_get_best_backend_enum_preference(self, manager):
+        """Test that enum and string preferences select the same backend."""
+        assert manager.get_best_backend(
+            hardware_preference=HardwarePreference.CPU
+        ) == manager.get_best_backend(hardware_preference='cpu')
+        
+        # Unknown preferences fall back to automatic selection
+        assert manager.get_best_backend(hardware_preference='fastest') == "ctransformers"
+    
+    def test_get_best_backend_no_available(self, manager):
         """Test best backend selection when no backends available."""
         # Clear available backends
-        for status in self.manager.backend_status.values():
-            status.available = False
+        for name in manager.backend_status:
+            manager.backend_status[name].available = False
         
-        best = self.manager.get_best_backend()
+        best = manager.get_best_backend()
         assert best is None
     
-    def test_can_handle_model_size_sufficient_memory(self):
+    def test_can_handle_model_size_sufficient_memory(self, manager):
         """Test model size handling with sufficient memory."""
-        can_handle = self.manager._can_handle_model_size("ctransformers", 2048)  # 2GB model
+        can_handle = manager._can_handle_model_size("ctransformers", 2048)  # 2GB model
         assert can_handle is True
     
-    def test_can_handle_model_size_insufficient_memory(self):
+    def test_can_handle_model_size_insufficient_memory(self, manager, hardware_detector):
         """Test model size handling with insufficient memory."""
         # Mock low memory system
-        self.mock_hardware_detector.get_hardware_info.return_value = HardwareInfo(
+        hardware_detector.get_hardware_info.return_value = HardwareInfo(
             total_ram=4096,  # Only 4GB RAM
             total_vram=2048   # Only 2GB VRAM
         )
         
-        can_handle = self.manager._can_handle_model_size("ctransformers", 8192)  # 8GB model
+        can_handle = manager._can_handle_model_size("ctransformers", 8192)  # 8GB model
         assert can_handle is False
     
-    def test_load_model_success(self, mock_model_file):
+    def test_hardware_info_cached_for_selection(self, manager, hardware_detector):
+        """Test that backend selection reuses cached hardware info."""
+        manager.get_best_backend(model_size_mb=4096)
+        manager.get_best_backend(model_size_mb=2048, hardware_preference='gpu')
+        manager._can_handle_model_size("transformers", 1024)
+        
+        hardware_detector.get_hardware_info.assert_called_once()
+    
+    def test_hardware_info_cache_invalidated(self, manager, hardware_detector):
+        """Test that the hardware info cache expires and is cleared on refresh."""
+        manager.get_best_backend()
+        
+        # Expired entries are re-detected
+        manager._hw_info_cached_at -= manager.HARDWARE_INFO_TTL + 1
+        manager.get_best_backend()
+        assert hardware_detector.get_hardware_info.call_count == 2
+        
+        # Refreshing availability drops the cache
+        with patch.object(manager, '_detect_available_backends'):
+            manager.refresh_backend_availability()
+        manager.get_best_backend()
+        assert hardware_detector.get_hardware_info.call_count == 3
+    
+    def test_load_model_success(self, mock_model_file, manager):
         """Test successful model loading."""
         # Mock backend instance
         mock_backend = Mock()
@@ -206,23 +300,23 @@ class TestBackendManager:
             memory_usage=4096
         )
         
-        with patch.object(self.manager, '_get_backend_instance', return_value=mock_backend):
-            result = self.manager.load_model(str(mock_model_file))
+        with patch.object(manager, '_get_backend_instance', return_value=mock_backend):
+            result = manager.load_model(str(mock_model_file))
         
         assert result.success is True
         assert result.backend_used == "ctransformers"
-        assert self.manager.current_backend == mock_backend
-        assert self.manager.current_model_path == str(mock_model_file)
+        assert manager.current_backend == mock_backend
+        assert manager.current_model_path == str(mock_model_file)
     
-    def test_load_model_nonexistent_file(self):
+    def test_load_model_nonexistent_file(self, manager):
         """Test model loading with nonexistent file."""
-        result = self.manager.load_model("nonexistent.gguf")
+        result = manager.load_model("nonexistent.gguf")
         
         assert result.success is False
         assert "does not exist" in result.error_message
-        assert self.manager.current_backend is None
+        assert manager.current_backend is None
     
-    def test_load_model_fallback_success(self, mock_model_file):
+    def test_load_model_fallback_success(self, mock_model_file, manager):
         """Test model loading with fallback to secondary backend."""
         # Mock first backend failure, second backend success
         mock_backend1 = Mock()
@@ -250,14 +344,22 @@ class TestBackendManager:
                 return mock_backend2
             return Mock()
         
-        with patch.object(self.manager, '_get_backend_instance', side_effect=mock_get_backend):
-            result = self.manager.load_model(str(mock_model_file))
+        with patch.object(manager, '_get_backend_instance', side_effect=mock_get_backend):
+            result = manager.load_model(str(mock_model_file))
         
         assert result.success is True
         assert result.backend_used == "transformers"
-        assert self.manager.current_backend == mock_backend2
+        assert manager.current_backend == mock_backend2
     
-    def test_load_model_all_backends_fail(self, mock_model_file):
+    def test_eligible_backends(self, manager):
+        """Test that only available backends enter the fallback chain, best first."""
+        assert manager._eligible_backends(4096) == ("ctransformers", "transformers")
+        
+        for name in manager.backend_status:
+            manager.backend_status[name].available = False
+        assert manager._eligible_backends(4096) == ()
+    
+    def test_load_model_all_backends_fail(self, mock_model_file, manager):
         """Test model loading when all backends fail."""
         # Mock all backends failing
         mock_backend = Mock()
@@ -269,14 +371,14 @@ class TestBackendManager:
             error_message="Backend failed"
         )
         
-        with patch.object(self.manager, '_get_backend_instance', return_value=mock_backend):
-            result = self.manager.load_model(str(mock_model_file))
+        with patch.object(manager, '_get_backend_instance', return_value=mock_backend):
+            result = manager.load_model(str(mock_model_file))
         
         assert result.success is False
         assert "All backends failed" in result.error_message
-        assert self.manager.current_backend is None
+        assert manager.current_backend is None
     
-    def test_load_model_specific_backend(self, mock_model_file):
+    def test_load_model_specific_backend(self, mock_model_file, manager):
         """Test loading model with specific backend."""
         mock_backend = Mock()
         mock_backend.load_model.return_value = LoadingResult(
@@ -287,77 +389,119 @@ class TestBackendManager:
             memory_usage=3072
         )
         
-        with patch.object(self.manager, '_get_backend_instance', return_value=mock_backend):
-            result = self.manager.load_model(str(mock_model_file), backend_name="transformers")
+        with patch.object(manager, '_get_backend_instance', return_value=mock_backend):
+            result = manager.load_model(str(mock_model_file), backend_name="transformers")
         
         assert result.success is True
         assert result.backend_used == "transformers"
-        assert self.manager.current_backend == mock_backend
+        assert manager.current_backend == mock_backend
+    
+    def test_forced_optimized_load_keeps_config(self, mock_model_file, hardware_detector):
+        """Test that configs set on a new manager survive its lazy initialization."""
+        with patch('core.backend_manager.monitoring_manager'), \
+             patch('core.performance_integration.PerformanceOptimizer'):
+            manager = PerformanceIntegratedBackendManager(hardware_detector)
+        
+        registry = Mock()
+        registry.backends = {"ctransformers": Mock()}
+        registry.get_default_configs.return_value = {
+            "ctransformers": BackendConfig(name="ctransformers")
+        }
+        registry.check_backend_availability.return_value = (BackendType.CTRANSFORMERS, True, None)
+        registry.get_backend.return_value.load_model.return_value = LoadingResult(
+            success=True,
+            backend_used="ctransformers",
+            hardware_used="gpu",
+            load_time=1.0
+        )
+        manager.registry = registry
+        
+        custom_config = BackendConfig(name="ctransformers", gpu_layers=12)
+        with patch.object(manager, '_ensure_backends_registered'):
+            manager.configs["ctransformers"] = custom_config
+            result = manager.load_model_optimized(str(mock_model_file), force_backend="ctransformers")
+        
+        assert result.success is True
+        assert manager.configs["ctransformers"] is custom_config
+        registry.get_backend.assert_called_once_with(BackendType.CTRANSFORMERS, custom_config)
     
-    def test_load_model_specific_backend_unavailable(self, mock_model_file):
+    def test_load_model_specific_backend_unavailable(self, mock_model_file, manager):
         """Test loading model with unavailable specific backend."""
-        result = self.manager.load_model(str(mock_model_file), backend_name="llamafile")
+        result = manager.load_model(str(mock_model_file), backend_name="llamafile")
         
         assert result.success is False
         assert "not available" in result.error_message
     
-    def test_generate_text_success(self):
+    def test_backend_instances_cached(self, manager):
+        """Test that backend instances are reused until availability is refreshed."""
+        manager.configs["transformers"] = BackendConfig(name="transformers")
+        
+        with patch.object(manager.registry, 'get_backend', side_effect=lambda *args: Mock()) as mock_get:
+            backend = manager._get_backend_instance("transformers")
+            assert manager._get_backend_instance("transformers") is backend
+            mock_get.assert_called_once()
+            
+            with patch.object(manager, '_detect_available_backends'):
+                manager.refresh_backend_availability()
+            
+            assert manager._get_backend_instance("transformers") is not backend
+            assert mock_get.call_count == 2
+    
+    def test_generate_text_success(self, manager):
         """Test successful text generation."""
         # Set up loaded backend
         mock_backend = Mock()
         mock_backend.generate_text.return_value = "Generated response"
         mock_backend.config.name = "ctransformers"
-        self.manager.current_backend = mock_backend
-        self.manager.current_model_path = "test.gguf"
+        manager.current_backend = mock_backend
+        manager.current_model_path = "test.gguf"
         
         gen_config = GenerationConfig(max_tokens=100)
         
-        with patch.object(self.manager.performance_monitor, 'start_operation', return_value="op_id"), \
-             patch.object(self.manager.performance_monitor, 'end_operation'):
-            
-            result = self.manager.generate_text("Hello", gen_config)
+        with patch.object(manager.performance_monitor, 'record_operation') as mock_record:
+            result = manager.generate_text("Hello", gen_config)
         
         assert result == "Generated response"
         mock_backend.generate_text.assert_called_once_with("Hello", gen_config)
+        mock_record.assert_called_once_with("ctransformers", "generate", "test.gguf")
     
-    def test_generate_text_no_model(self):
+    def test_generate_text_no_model(self, manager):
         """Test text generation without loaded model."""
         gen_config = GenerationConfig()
         
         with pytest.raises(ModelLoadingError, match="No model is currently loaded"):
-            self.manager.generate_text("Hello", gen_config)
+            manager.generate_text("Hello", gen_config)
     
-    def test_unload_model_success(self):
+    def test_unload_model_success(self, manager):
         """Test successful model unloading."""
         # Set up loaded backend
         mock_backend = Mock()
         mock_backend.unload_model.return_value = True
         mock_backend.config.name = "ctransformers"
-        self.manager.current_backend = mock_backend
-        self.manager.current_model_path = "test.gguf"
+        manager.current_backend = mock_backend
+        manager.current_model_path = "test.gguf"
         
-        with patch.object(self.manager.performance_monitor, 'start_operation', return_value="op_id"), \
-             patch.object(self.manager.performance_monitor, 'end_operation'):
-            
-            success = self.manager.unload_model()
+        with patch.object(manager.performance_monitor, 'record_operation') as mock_record:
+            success = manager.unload_model()
         
         assert success is True
-        assert self.manager.current_backend is None
-        assert self.manager.current_model_path is None
+        assert manager.current_backend is None
+        assert manager.current_model_path is None
         mock_backend.unload_model.assert_called_once()
+        mock_record.assert_called_once_with("ctransformers", "unload", "test.gguf")
     
-    def test_unload_model_no_model(self):
+    def test_unload_model_no_model(self, manager):
         """Test unloading when no model is loaded."""
-        success = self.manager.unload_model()
+        success = manager.unload_model()
         assert success is True
     
-    def test_switch_backend_success(self, mock_model_file):
+    def test_switch_backend_success(self, mock_model_file, manager):
         """Test successful backend switching."""
         # Set up current backend
         mock_current_backend = Mock()
         mock_current_backend.unload_model.return_value = True
-        self.manager.current_backend = mock_current_backend
-        self.manager.current_model_path = str(mock_model_file)
+        manager.current_backend = mock_current_backend
+        manager.current_model_path = str(mock_model_file)
         
         # Mock new backend
         mock_new_backend = Mock()
@@ -368,31 +512,31 @@ class TestBackendManager:
             load_time=2.0
         )
         
-        with patch.object(self.manager, '_get_backend_instance', return_value=mock_new_backend):
-            success = self.manager.switch_backend("transformers", reload_model=True)
+        with patch.object(manager, '_get_backend_instance', return_value=mock_new_backend):
+            success = manager.switch_backend("transformers", reload_model=True)
         
         assert success is True
-        assert self.manager.current_backend == mock_new_backend
+        assert manager.current_backend == mock_new_backend
         mock_current_backend.unload_model.assert_called_once()
         mock_new_backend.load_model.assert_called_once_with(str(mock_model_file), "transformers")
     
-    def test_switch_backend_unavailable(self):
+    def test_switch_backend_unavailable(self, manager):
         """Test switching to unavailable backend."""
-        success = self.manager.switch_backend("llamafile")
+        success = manager.switch_backend("llamafile")
         assert success is False
     
-    def test_switch_backend_no_reload(self):
+    def test_switch_backend_no_reload(self, manager):
         """Test backend switching without model reload."""
         # Set up current backend
         mock_current_backend = Mock()
         mock_current_backend.unload_model.return_value = True
-        self.manager.current_backend = mock_current_backend
+        manager.current_backend = mock_current_backend
         
-        success = self.manager.switch_backend("transformers", reload_model=False)
+        success = manager.switch_backend("transformers", reload_model=False)
         assert success is True
         mock_current_backend.unload_model.assert_called_once()
     
-    def test_get_current_backend_info_loaded(self):
+    def test_get_current_backend_info_loaded(self, manager):
         """Test getting current backend info when model is loaded."""
         mock_backend = Mock()
         mock_backend.get_model_info.return_value = {
@@ -400,44 +544,63 @@ class TestBackendManager:
             "model_path": "test.gguf",
             "load_time": 2.5
         }
-        self.manager.current_backend = mock_backend
+        manager.current_backend = mock_backend
         
-        info = self.manager.get_current_backend_info()
+        info = manager.get_current_backend_info()
         
         assert info is not None
         assert info["backend"] == "ctransformers"
         assert info["model_path"] == "test.gguf"
         mock_backend.get_model_info.assert_called_once()
     
-    def test_get_current_backend_info_no_model(self):
+    def test_get_current_backend_info_no_model(self, manager):
         """Test getting current backend info when no model is loaded."""
-        info = self.manager.get_current_backend_info()
+        info = manager.get_current_backend_info()
         assert info is None
     
-    def test_get_hardware_info(self):
+    def test_get_hardware_info(self, manager, hardware_detector):
         """Test getting hardware information."""
-        hw_info = self.manager.get_hardware_info()
+        hw_info = manager.get_hardware_info()
         
         assert isinstance(hw_info, HardwareInfo)
         assert hw_info.gpu_count == 1
         assert hw_info.total_vram == 8192
-        self.mock_hardware_detector.get_hardware_info.assert_called_once()
+        
+        # Repeated calls within the TTL reuse the detected info
+        assert manager.get_hardware_info() is hw_info
+        hardware_detector.get_hardware_info.assert_called_once()
     
-    def test_refresh_backend_availability(self):
+    def test_refresh_backend_availability(self, manager):
         """Test refreshing backend availability."""
-        with patch.object(self.manager, '_detect_available_backends') as mock_detect:
-            self.manager.refresh_backend_availability()
+        with patch.object(manager, '_detect_available_backends') as mock_detect:
+            manager.refresh_backend_availability()
             mock_detect.assert_called_once()
     
-    def test_get_statistics(self):
+    def test_detect_available_backends(self, manager):
+        """Test that every registered backend is probed, in registration order."""
+        registry = Mock()
+        registry.backends = {"transformers": Mock(), "ctransformers": Mock(), "llamafile": Mock()}
+        registry.check_backend_availability.side_effect = lambda name: (
+            BackendType(name), name != "llamafile", "Not installed" if name == "llamafile" else None
+        )
+        manager.registry = registry
+        manager.backend_status = {}
+        
+        manager._detect_available_backends()
+        
+        assert list(manager.backend_status) == ["transformers", "ctransformers", "llamafile"]
+        assert manager.get_available_backends() == ["transformers", "ctransformers"]
+        assert manager.backend_status["llamafile"].error_message == "Not installed"
+    
+    def test_get_statistics(self, manager):
         """Test getting backend statistics."""
         # Set up some statistics
-        self.manager.backend_status["ctransformers"].load_attempts = 10
-        self.manager.backend_status["ctransformers"].success_count = 8
-        self.manager.backend_status["ctransformers"].failure_count = 2
-        self.manager.backend_status["ctransformers"].average_load_time = 2.5
+        manager.backend_status["ctransformers"].load_attempts = 10
+        manager.backend_status["ctransformers"].success_count = 8
+        manager.backend_status["ctransformers"].failure_count = 2
+        manager.backend_status["ctransformers"].average_load_time = 2.5
         
-        stats = self.manager.get_statistics()
+        stats = manager.get_statistics()
         
         assert isinstance(stats, dict)
         assert "ctransformers" in stats
@@ -449,7 +612,7 @@ class TestBackendManager:
         assert ctransformers_stats["success_rate"] == 0.8
         assert ctransformers_stats["average_load_time"] == 2.5
     
-    def test_get_monitoring_report(self):
+    def test_get_monitoring_report(self, manager):
         """Test getting comprehensive monitoring report."""
         # Mock monitoring components
         mock_performance_stats = {"ctransformers": {"avg_load_time": 2.5}}
@@ -464,9 +627,9 @@ class TestBackendManager:
             }
         ]
         
-        with patch.object(self.manager.performance_monitor, 'get_backend_stats', return_value=mock_performance_stats), \
-             patch.object(self.manager.monitoring_manager.system_monitor, 'get_current_metrics', return_value=mock_system_metrics), \
-             patch.object(self.manager.performance_monitor, 'get_recent_metrics') as mock_recent:
+        with patch.object(manager.performance_monitor, 'get_backend_stats', return_value=mock_performance_stats), \
+             patch.object(manager.monitoring_manager.system_monitor, 'get_current_metrics', return_value=mock_system_metrics), \
+             patch.object(manager.performance_monitor, 'get_recent_metrics') as mock_recent:
             
             # Mock recent metrics with proper structure
             mock_metric = Mock()
@@ -479,7 +642,7 @@ class TestBackendManager:
             mock_metric.error_message = None
             mock_recent.return_value = [mock_metric]
             
-            report = self.manager.get_monitoring_report()
+            report = manager.get_monitoring_report()
         
         assert isinstance(report, dict)
         assert "backend_statistics" in report
@@ -492,7 +655,7 @@ class TestBackendManager:
         assert report["system_metrics"] == mock_system_metrics
         assert len(report["recent_operations"]) == 1
     
-    def test_callback_registration(self):
+    def test_callback_registration(self, manager):
         """Test callback registration and triggering."""
         backend_changed_calls = []
         fallback_triggered_calls = []
@@ -508,58 +671,85 @@ class TestBackendManager:
             loading_progress_calls.append((message, progress))
         
         # Register callbacks
-        self.manager.on_backend_changed = on_backend_changed
-        self.manager.on_fallback_triggered = on_fallback_triggered
-        self.manager.on_loading_progress = on_loading_progress
+        manager.on_backend_changed = on_backend_changed
+        manager.on_fallback_triggered = on_fallback_triggered
+        manager.on_loading_progress = on_loading_progress
         
         # Test backend changed callback
-        if self.manager.on_backend_changed:
-            self.manager.on_backend_changed("ctransformers", "test.gguf")
+        if manager.on_backend_changed:
+            manager.on_backend_changed("ctransformers", "test.gguf")
         
         assert len(backend_changed_calls) == 1
         assert backend_changed_calls[0] == ("ctransformers", "test.gguf")
         
         # Test fallback triggered callback
-        if self.manager.on_fallback_triggered:
-            self.manager.on_fallback_triggered("ctransformers", "transformers", "GPU error")
+        if manager.on_fallback_triggered:
+            manager.on_fallback_triggered("ctransformers", "transformers", "GPU error")
         
         assert len(fallback_triggered_calls) == 1
         assert fallback_triggered_calls[0] == ("ctransformers", "transformers", "GPU error")
         
         # Test loading progress callback
-        if self.manager.on_loading_progress:
-            self.manager.on_loading_progress("Loading model...", 50)
+        if manager.on_loading_progress:
+            manager.on_loading_progress("Loading model...", 50)
         
         assert len(loading_progress_calls) == 1
         assert loading_progress_calls[0] == ("Loading model...", 50)
     
-    def test_cleanup(self):
+    def test_event_listeners(self, mock_model_file, manager):
+        """Test that load_model notifies every registered listener."""
+        changed_a = Mock()
+        changed_b = Mock()
+        manager.on('backend_changed', changed_a)
+        manager.on('backend_changed', changed_b)
+        
+        mock_backend = Mock()
+        mock_backend.load_model.return_value = LoadingResult(
+            success=True,
+            backend_used="ctransformers",
+            hardware_used="cpu",
+            load_time=1.0
+        )
+        
+        with patch.object(manager, '_get_backend_instance', return_value=mock_backend):
+            manager.load_model(str(mock_model_file))
+        
+        changed_a.assert_called_once_with("ctransformers", str(mock_model_file))
+        changed_b.assert_called_once_with("ctransformers", str(mock_model_file))
+        
+        # Assigning the attribute replaces the listeners; None removes them
+        manager.on_backend_changed = changed_a
+        assert manager._listeners['backend_changed'] == (changed_a,)
+        manager.on_backend_changed = None
+        assert manager.on_backend_changed is None
+    
+    def test_cleanup(self, manager):
         """Test backend manager cleanup."""
         # Set up backends
         mock_backend1 = Mock()
         mock_backend2 = Mock()
-        self.manager.backends = {
+        manager.backends = {
             "ctransformers": mock_backend1,
             "transformers": mock_backend2
         }
-        self.manager.current_backend = mock_backend1
+        manager.current_backend = mock_backend1
         
-        self.manager.cleanup()
+        manager.cleanup()
         
         # Should unload all backends
         mock_backend1.unload_model.assert_called()
         mock_backend2.unload_model.assert_called()
         
         # Should clear backends dict
-        assert len(self.manager.backends) == 0
+        assert len(manager.backends) == 0
     
-    def test_monitoring_lifecycle(self):
+    def test_monitoring_lifecycle(self, manager):
         """Test monitoring system lifecycle."""
-        with patch.object(self.manager.monitoring_manager, 'start') as mock_start, \
-             patch.object(self.manager.monitoring_manager, 'stop') as mock_stop:
+        with patch.object(manager.monitoring_manager, 'start') as mock_start, \
+             patch.object(manager.monitoring_manager, 'stop') as mock_stop:
             
-            self.manager.start_monitoring()
+            manager.start_monitoring()
             mock_start.assert_called_once()
             
-            self.manager.stop_monitoring()
+            manager.stop_monitoring()
             mock_stop.assert_called_once()
\ No newline at end of file
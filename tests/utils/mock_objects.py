@@ -3,9 +3,10 @@ Mock objects for testing.
 """
 
 import os
+import copy
+from functools import lru_cache
+from types import SimpleNamespace
 from unittest.mock import MagicMock
-from app.models.gguf_model import GGUFModel
-from app.models.app_config import AppConfig
 from interfaces.i_addon import AddonState, AddonMetadata
 
 class MockGGUFModel:
@@ -22,31 +23,39 @@ class MockGGUFModel:
             file_path: Path to the model file
             
         Returns:
-            Mock GGUFModel instance
+            Namespace with the GGUFModel attributes the tests read
         """
-        model = MagicMock(spec=GGUFModel)
-        model.id = model_id
-        model.name = name
-        model.file_path = file_path or f"/path/to/{name.lower().replace(' ', '_')}.gguf"
-        model.size = 1024 * 1024  # 1 MB
-        model.parameters = {
-            "model_type": "llama",
-            "context_length": 2048,
-            "embedding_length": 4096,
-            "vocab_size": 32000,
-            "num_layers": 32,
-            "num_heads": 32
-        }
-        model.metadata = {
-            "description": "Test model for testing",
-            "author": "Test Author",
-            "license": "MIT",
-            "created_at": "2023-01-01"
-        }
-        model.loaded = False
-        model.memory_usage = 0
-        
-        return model
+        return SimpleNamespace(
+            id=model_id,
+            name=name,
+            file_path=file_path or f"/path/to/{name.lower().replace(' ', '_')}.gguf",
+            size=1024 * 1024,  # 1 MB
+            parameters={
+                "model_type": "llama",
+                "context_length": 2048,
+                "embedding_length": 4096,
+                "vocab_size": 32000,
+                "num_layers": 32,
+                "num_heads": 32
+            },
+            metadata={
+                "description": "Test model for testing",
+                "author": "Test Author",
+                "license": "MIT",
+                "created_at": "2023-01-01"
+            },
+            loaded=False,
+            memory_usage=0
+        )
+
+@lru_cache(maxsize=None)
+def _default_mock_models():
+    """Build the default models shared by MockModelManager instances."""
+    return {
+        "model1": MockGGUFModel.create_mock("model1", "Model 1"),
+        "model2": MockGGUFModel.create_mock("model2", "Model 2"),
+        "model3": MockGGUFModel.create_mock("model3", "Model 3")
+    }
 
 class MockAddon:
     """Mock implementation of an addon."""
@@ -98,52 +107,51 @@ class MockAppConfig:
         Create a mock application configuration.
         
         Returns:
-            Mock AppConfig instance
+            Namespace with the AppConfig attributes the tests read
         """
-        config = MagicMock(spec=AppConfig)
-        config.theme = "default"
-        config.recent_models = []
-        config.window_size = (800, 600)
-        config.default_model_dir = os.path.expanduser("~/Documents/GGUF Models")
-        config.addon_dir = "addons"
-        config.log_level = "INFO"
-        
-        return config
+        return SimpleNamespace(
+            theme="default",
+            recent_models=[],
+            window_size=(800, 600),
+            default_model_dir=os.path.expanduser("~/Documents/GGUF Models"),
+            addon_dir="addons",
+            log_level="INFO"
+        )
 
 class MockModelManager:
     """Mock implementation of a model manager."""
     
     @staticmethod
-    def create_mock(models=None):
+    def create_mock(models=None, fresh=False):
         """
         Create a mock model manager.
         
         Args:
             models: Dictionary of model_id -> model instances
+            fresh: With the default models, give this manager its own copies
+                instead of the shared ones (for tests that modify them)
             
         Returns:
             Mock model manager
         """
-        from app.core.model_manager import ModelManager
-        
-        # Create default models if none provided
+        # Use the default models if none provided
         if models is None:
-            models = {
-                "model1": MockGGUFModel.create_mock("model1", "Model 1"),
-                "model2": MockGGUFModel.create_mock("model2", "Model 2"),
-                "model3": MockGGUFModel.create_mock("model3", "Model 3")
-            }
+            models = copy.deepcopy(_default_mock_models()) if fresh else _default_mock_models()
         
-        # Create mock manager
-        manager = MagicMock(spec=ModelManager)
+        # Create mock manager (no spec: introspecting the real class on
+        # every call costs more than the checking is worth here)
+        manager = MagicMock()
         
         # Set up methods
         manager.get_all_models.return_value = list(models.keys())
-        manager.get_model.side_effect = lambda model_id: models.get(model_id)
-        manager.load_model.side_effect = lambda file_path: next(
-            (model_id for model_id, model in models.items() if model.file_path == file_path),
-            None
-        )
+        manager.get_model.side_effect = models.get
+        
+        # Path -> model_id lookup built once (first model wins on duplicate
+        # paths); reflects the models' file paths at creation time
+        model_ids_by_path = {
+            model.file_path: model_id for model_id, model in reversed(list(models.items()))
+        }
+        manager.load_model.side_effect = model_ids_by_path.get
         manager.unload_model.return_value = True
         
         return manager
@@ -162,10 +170,6 @@ class MockAddonManager:
         Returns:
             Mock addon manager
         """
-        from app.core.addon_manager import AddonManager
-        from app.core.addon_registry import AddonRegistry
-        from app.core.addon_loader import AddonLoader
-        
         # Create default addons if none provided
         if addons is None:
             addons = {
@@ -174,22 +178,27 @@ class MockAddonManager:
                 "addon3": MockAddon.create_mock("addon3", "Addon 3", "1.0.0", True)
             }
         
+        # Per-field lookups built once; unknown ids give None
+        instances = {addon_id: entry[0] for addon_id, entry in addons.items()}
+        metadata = {addon_id: entry[1] for addon_id, entry in addons.items()}
+        states = {addon_id: entry[2] for addon_id, entry in addons.items()}
+        
         # Create mock registry
-        registry = MagicMock(spec=AddonRegistry)
+        registry = MagicMock()
         registry.get_all_addons.return_value = list(addons.keys())
-        registry.get_addon_metadata.side_effect = lambda addon_id: addons.get(addon_id, (None, None, None))[1]
-        registry.get_addon_state.side_effect = lambda addon_id: addons.get(addon_id, (None, None, None))[2]
+        registry.get_addon_metadata.side_effect = metadata.get
+        registry.get_addon_state.side_effect = states.get
         
         # Create mock loader
-        loader = MagicMock(spec=AddonLoader)
+        loader = MagicMock()
         
-        # Create mock manager
-        manager = MagicMock(spec=AddonManager)
+        # Create mock manager (unspecced, like the model manager)
+        manager = MagicMock()
         manager.registry = registry
         manager.loader = loader
         
         # Set up methods
-        manager.get_addon_instance.side_effect = lambda addon_id: addons.get(addon_id, (None, None, None))[0]
+        manager.get_addon_instance.side_effect = instances.get
         manager.enable_addon.side_effect = lambda addon_id: (True, None) if addon_id != "addon-error" else (False, "Error enabling addon")
         manager.disable_addon.side_effect = lambda addon_id: (True, None) if addon_id != "addon-error" else (False, "Error disabling addon")
         manager.uninstall_addon.side_effect = lambda addon_id: (True, None) if addon_id != "addon-error" else (False, "Error uninstalling addon")
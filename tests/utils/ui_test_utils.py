@@ -4,225 +4,391 @@ Utilities for UI testing.
 
 import os
 import sys
-import time
-from contextlib import contextmanager
-from unittest.mock import MagicMock, patch
+from functools import lru_cache
+from unittest.mock import Mock, patch
 
-from PySide6.QtCore import Qt, QTimer, QPoint, QSize
-from PySide6.QtWidgets import QApplication, QWidget, QMainWindow
-from PySide6.QtTest import QTest
+from PySide6.QtCore import Qt, QEvent, QEventLoop, QObject, QPointF, QTimer, QSize
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication, QMessageBox, QWidget, QMainWindow
+from PySide6.QtTest import QSignalSpy, QTest
 
-class UITestCase:
-    """Base class for UI test cases."""
+# QTest helpers used on every simulated interaction
+_mouse_click = QTest.mouseClick
+_mouse_dclick = QTest.mouseDClick
+_key_clicks = QTest.keyClicks
+
+
+@lru_cache(maxsize=32)
+def _left_click_events(x, y):
+    """Build a reusable left-button press/release pair at a local position."""
+    pos = QPointF(x, y)
+    press = QMouseEvent(QEvent.MouseButtonPress, pos, pos, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+    release = QMouseEvent(QEvent.MouseButtonRelease, pos, pos, Qt.LeftButton, Qt.NoButton, Qt.NoModifier)
+    return press, release
+
+
+class _ShowWatcher(QObject):
+    """Event filter that stops an event loop when a window of a class is shown."""
     
-    @staticmethod
-    def process_events():
-        """Process pending Qt events."""
-        QApplication.processEvents()
+    def __init__(self, window_class, loop):
+        super().__init__()
+        self.window_class = window_class
+        self.loop = loop
+        self.window = None
     
-    @staticmethod
-    def wait(ms):
-        """
-        Wait for the specified number of milliseconds.
-        
-        Args:
-            ms: Time to wait in milliseconds
-        """
-        start = time.time()
-        end = start + (ms / 1000.0)
-        while time.time() < end:
-            QApplication.processEvents()
-            time.sleep(0.01)
-    
-    @staticmethod
-    def click_button(button):
-        """
-        Click a button.
-        
-        Args:
-            button: The button to click
-        """
-        QTest.mouseClick(button, Qt.LeftButton)
-    
-    @staticmethod
-    def click_item(widget, point=None):
-        """
-        Click an item in a widget.
-        
-        Args:
-            widget: The widget to click
-            point: The point to click (default: center)
-        """
-        if point is None:
-            point = QPoint(widget.width() // 2, widget.height() // 2)
-        QTest.mouseClick(widget, Qt.LeftButton, pos=point)
-    
-    @staticmethod
-    def double_click_item(widget, point=None):
-        """
-        Double-click an item in a widget.
-        
-        Args:
-            widget: The widget to click
-            point: The point to click (default: center)
-        """
-        if point is None:
-            point = QPoint(widget.width() // 2, widget.height() // 2)
-        QTest.mouseDClick(widget, Qt.LeftButton, pos=point)
-    
-    @staticmethod
-    def enter_text(widget, text):
-        """
-        Enter text in a widget.
-        
-        Args:
-            widget: The widget to enter text into
-            text: The text to enter
-        """
-        widget.clear()
-        QTest.keyClicks(widget, text)
-    
-    @staticmethod
-    def select_combo_item(combo_box, index):
-        """
-        Select an item in a combo box.
-        
-        Args:
-            combo_box: The combo box
-            index: The index to select
-        """
-        combo_box.setCurrentIndex(index)
-        UITestCase.process_events()
-    
-    @staticmethod
-    def select_list_item(list_widget, index):
-        """
-        Select an item in a list widget.
-        
-        Args:
-            list_widget: The list widget
-            index: The index to select
-        """
-        list_widget.setCurrentRow(index)
-        UITestCase.process_events()
-    
-    @staticmethod
-    def check_checkbox(checkbox, checked=True):
-        """
-        Check or uncheck a checkbox.
-        
-        Args:
-            checkbox: The checkbox
-            checked: Whether to check or uncheck
-        """
-        if checkbox.isChecked() != checked:
-            UITestCase.click_button(checkbox)
-    
-    @staticmethod
-    def resize_widget(widget, width, height):
-        """
-        Resize a widget.
-        
-        Args:
-            widget: The widget to resize
-            width: The new width
-            height: The new height
-        """
-        widget.resize(QSize(width, height))
-        UITestCase.process_events()
-    
-    @staticmethod
-    @contextmanager
-    def wait_for_window(window_class):
-        """
-        Wait for a window to appear.
-        
-        Args:
-            window_class: The window class to wait for
-            
-        Yields:
-            The found window
-        """
-        found_window = None
-        
-        # Find the window
-        for _ in range(50):  # Try for up to 5 seconds (50 * 0.1s)
-            for window in QApplication.topLevelWidgets():
-                if isinstance(window, window_class):
-                    found_window = window
-                    break
-            
-            if found_window is not None:
-                break
-            
-            UITestCase.wait(100)
-        
-        if found_window is None:
-            raise TimeoutError(f"Window of class {window_class.__name__} did not appear")
-        
-        yield found_window
+    def eventFilter(self, obj, event):
+        if (self.window is None and event.type() == QEvent.Show
+                and isinstance(obj, self.window_class) and obj.isWindow()):
+            self.window = obj
+            self.loop.quit()
+        return False
+
+
+class _WaitForWindow:
+    """Context manager behind wait_for_window."""
     
-    @staticmethod
-    @contextmanager
-    def wait_for_signal(signal, timeout=1000):
-        """
-        Wait for a signal to be emitted.
-        
-        Args:
-            signal: The signal to wait for
-            timeout: Timeout in milliseconds
-            
-        Yields:
-            A list that will contain the signal arguments when emitted
-        """
-        result = []
-        
-        def slot(*args):
-            result.extend(args)
+    def __init__(self, window_class, timeout=5000):
+        self.window_class = window_class
+        self.timeout = timeout
+    
+    def __enter__(self):
+        found_window = next(
+            (window for window in QApplication.topLevelWidgets() if isinstance(window, self.window_class)),
+            None
+        )
         
-        connection = signal.connect(slot)
-        try:
-            yield result
-            
-            # Start a timer to handle the timeout
+        if found_window is None:
+            # Block until a matching window is shown or the timeout expires
+            app = _get_app()
+            loop = QEventLoop()
+            watcher = _ShowWatcher(self.window_class, loop)
             timer = QTimer()
             timer.setSingleShot(True)
-            timer.start(timeout)
+            timer.timeout.connect(loop.quit)
             
-            # Wait for either the signal or the timeout
-            while not result and timer.isActive():
-                QApplication.processEvents()
-                time.sleep(0.01)
-        finally:
-            signal.disconnect(connection)
-    
-    @staticmethod
-    def capture_dialog(dialog_class, return_value=None):
-        """
-        Capture a dialog and return a predefined value.
+            app.installEventFilter(watcher)
+            try:
+                timer.start(self.timeout)
+                loop.exec()
+            finally:
+                timer.stop()
+                app.removeEventFilter(watcher)
+            found_window = watcher.window
         
-        Args:
-            dialog_class: The dialog class to capture
-            return_value: The value to return from the dialog
-            
-        Returns:
-            A context manager that captures the dialog
-        """
-        mock_dialog = MagicMock()
-        if return_value is not None:
-            mock_dialog.exec.return_value = return_value
+        if found_window is None:
+            raise TimeoutError(f"Window of class {self.window_class.__name__} did not appear")
         
-        return patch(dialog_class, return_value=mock_dialog)
+        return found_window
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class _WaitForSignal:
+    """Context manager behind wait_for_signal."""
+    
+    def __init__(self, signal, timeout):
+        self.signal = signal
+        self.timeout = timeout
+        self.result = []
+        self.spy = None
+    
+    def __enter__(self):
+        self.spy = QSignalSpy(self.signal)
+        return self.result
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Emissions are recorded by the spy; only block if none happened yet
+        if exc_type is None and (self.spy.count() or self.spy.wait(self.timeout)):
+            self.result.extend(self.spy.at(0))
+        self.spy = None
+        return False
+
+
+_app = None
+
+
+def _get_app():
+    """Return the QApplication, creating it on first use if needed."""
+    global _app
+    if _app is None:
+        _app = QApplication.instance() or QApplication([])
+    return _app
+
+
+def process_events():
+    """Process pending Qt events."""
+    _get_app().processEvents()
+
+
+def wait(ms):
+    """
+    Wait for the specified number of milliseconds.
+    
+    Args:
+        ms: Time to wait in milliseconds
+    """
+    QTest.qWait(int(ms))
+
+
+def click_button(button):
+    """
+    Click a button.
+    
+    Args:
+        button: The button to click
+    """
+    _mouse_click(button, Qt.LeftButton)
+
+
+def click_button_fast(button):
+    """
+    Click a button by sending cached mouse events directly.
+    
+    For tight click loops. Unlike click_button(), this skips QTest's
+    mouse grab, focus and double-click handling.
+    
+    Args:
+        button: The button to click
+    """
+    center = button.rect().center()
+    press, release = _left_click_events(center.x(), center.y())
+    QApplication.sendEvent(button, press)
+    QApplication.sendEvent(button, release)
+
+
+def click_item(widget, point=None):
+    """
+    Click an item in a widget.
+    
+    Args:
+        widget: The widget to click
+        point: The point to click (default: center)
+    """
+    if point is None:
+        # QTest defaults to the widget center
+        _mouse_click(widget, Qt.LeftButton)
+    else:
+        _mouse_click(widget, Qt.LeftButton, pos=point)
+
+
+def double_click_item(widget, point=None):
+    """
+    Double-click an item in a widget.
+    
+    Args:
+        widget: The widget to click
+        point: The point to click (default: center)
+    """
+    if point is None:
+        # QTest defaults to the widget center
+        _mouse_dclick(widget, Qt.LeftButton)
+    else:
+        _mouse_dclick(widget, Qt.LeftButton, pos=point)
+
+
+def enter_text(widget, text):
+    """
+    Enter text in a widget.
+    
+    Sets the text in one call (emitting textEdited where the widget has
+    it); use type_text() to exercise key press handling.
+    
+    Args:
+        widget: The widget to enter text into
+        text: The text to enter
+    """
+    setter = getattr(widget, 'setPlainText', None) or getattr(widget, 'setText', None)
+    if setter is None:
+        type_text(widget, text)
+        return
+    
+    setter(text)
+    text_edited = getattr(widget, 'textEdited', None)
+    if text_edited is not None:
+        text_edited.emit(text)
+
+
+def type_text(widget, text):
+    """
+    Type text into a widget one key at a time.
+    
+    Args:
+        widget: The widget to type into
+        text: The text to type
+    """
+    widget.clear()
+    _key_clicks(widget, text)
+
+
+def select_combo_item(combo_box, index, flush=False):
+    """
+    Select an item in a combo box.
+    
+    Args:
+        combo_box: The combo box
+        index: The index to select
+        flush: Also process pending events afterwards (the selection
+            signals are emitted synchronously, so this is only needed
+            for queued updates)
+    """
+    combo_box.setCurrentIndex(index)
+    if flush:
+        process_events()
+
+
+def select_list_item(list_widget, index, flush=False):
+    """
+    Select an item in a list widget.
+    
+    Args:
+        list_widget: The list widget
+        index: The index to select
+        flush: Also process pending events afterwards (the selection
+            signals are emitted synchronously, so this is only needed
+            for queued updates)
+    """
+    list_widget.setCurrentRow(index)
+    if flush:
+        process_events()
+
+
+def check_checkbox(checkbox, checked=True):
+    """
+    Check or uncheck a checkbox.
+    
+    Sets the state directly (emitting toggled/stateChanged); use
+    click_button() when a test needs the clicked signal.
+    
+    Args:
+        checkbox: The checkbox
+        checked: Whether to check or uncheck
+    """
+    if checkbox.isChecked() != checked:
+        checkbox.setChecked(checked)
+        process_events()
+
+
+def resize_widget(widget, width, height, flush=True):
+    """
+    Resize a widget.
+    
+    Args:
+        widget: The widget to resize
+        width: The new width
+        height: The new height
+        flush: Process pending events afterwards; pass False when chaining
+            several changes and call process_events() once at the end
+    """
+    widget.resize(QSize(width, height))
+    if flush:
+        process_events()
+
+
+def wait_for_window(window_class):
+    """
+    Wait for a window to appear.
+    
+    Args:
+        window_class: The window class to wait for
+    
+    Returns:
+        A context manager that yields the found window
+    """
+    return _WaitForWindow(window_class)
+
+
+def wait_for_signal(signal, timeout=1000):
+    """
+    Wait for a signal to be emitted.
+    
+    Args:
+        signal: The signal to wait for
+        timeout: Timeout in milliseconds
     
-    @staticmethod
-    def capture_message_box(return_value=None):
-        """
-        Capture a message box and return a predefined value.
+    Returns:
+        A context manager that yields a list which will contain the
+        arguments of the first emission
+    """
+    return _WaitForSignal(signal, timeout)
+
+
+def capture_dialog(dialog_class, return_value=None):
+    """
+    Capture a dialog and return a predefined value.
+    
+    Args:
+        dialog_class: The dialog class to capture
+        return_value: The value to return from the dialog
+    
+    Returns:
+        A context manager that captures the dialog
+    """
+    # Plain Mock: accepts any dialog setup calls without MagicMock's
+    # magic-method configuration
+    mock_dialog = Mock()
+    if return_value is not None:
+        mock_dialog.exec.return_value = return_value
+    
+    return patch(dialog_class, new_callable=Mock, return_value=mock_dialog)
+
+
+def capture_message_box(return_value=None):
+    """
+    Capture a message box and return a predefined value.
+    
+    Args:
+        return_value: The value to return from the message box
+    
+    Returns:
+        A context manager that captures the message box
+    """
+    return patch('PySide6.QtWidgets.QMessageBox.exec', new_callable=Mock, return_value=return_value)
+
+
+def capture_message_box_fast(return_value=None):
+    """
+    Capture a message box without creating a mock.
+    
+    Swaps QMessageBox.exec for a plain function, so no calls are
+    recorded; use capture_message_box() when a test asserts on them.
+    
+    Args:
+        return_value: The value to return from the message box
         
-        Args:
-            return_value: The value to return from the message box
-            
-        Returns:
-            A context manager that captures the message box
-        """
-        return patch('PySide6.QtWidgets.QMessageBox.exec', return_value=return_value)
\ No newline at end of file
+    Returns:
+        A context manager that captures the message box
+    """
+    # patch.object restores the inherited QDialog.exec on exit rather than
+    # leaving a copy of it on QMessageBox
+    return patch.object(QMessageBox, 'exec', new=lambda self, *args, **kwargs: return_value)
+
+
+class UITestCase:
+    """
+    Base class for UI test cases.
+    
+    Exposes the module-level helpers as static methods; tests may also call
+    the functions directly. Declares empty __slots__; subclasses that also
+    declare __slots__ avoid a per-instance __dict__.
+    """
+    
+    __slots__ = ()
+    
+    process_events = staticmethod(process_events)
+    wait = staticmethod(wait)
+    click_button = staticmethod(click_button)
+    click_button_fast = staticmethod(click_button_fast)
+    click_item = staticmethod(click_item)
+    double_click_item = staticmethod(double_click_item)
+    enter_text = staticmethod(enter_text)
+    type_text = staticmethod(type_text)
+    select_combo_item = staticmethod(select_combo_item)
+    select_list_item = staticmethod(select_list_item)
+    check_checkbox = staticmethod(check_checkbox)
+    resize_widget = staticmethod(resize_widget)
+    wait_for_window = staticmethod(wait_for_window)
+    wait_for_signal = staticmethod(wait_for_signal)
+    capture_dialog = staticmethod(capture_dialog)
+    capture_message_box = staticmethod(capture_message_box)
+    capture_message_box_fast = staticmethod(capture_message_box_fast)